@@ -0,0 +1,79 @@
+"""
+Логирование NewsClassify AI
+
+Сообщения идут через стандартный logging с логгерами "newsclassify.*".
+Сообщения по каждой статье проходят через ArticleLog: по умолчанию он
+выключен, и проверка в горячем цикле стоит одно чтение атрибута.
+
+Настройка через окружение:
+    NEWSCLASSIFY_LOG_LEVEL=DEBUG              - уровень логов (по умолчанию INFO)
+    NEWSCLASSIFY_ARTICLE_LOG_SAMPLE=0.01      - доля статей в отладочном логе (0..1)
+"""
+
+import logging
+import os
+import random
+import sys
+
+
+ROOT_LOGGER = "newsclassify"
+
+
+def get_logger(name):
+    """Логгер модуля приложения"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+class ArticleLog:
+    """Отладочный лог по отдельным статьям с выборкой
+
+    Вызывающий код проверяет enabled перед форматированием:
+
+        if article_log.enabled:
+            article_log.debug("статья %s → %s", title, topic)
+    """
+
+    def __init__(self, logger):
+        self.logger = logger
+        self.sample_rate = 0.0
+        self.enabled = False
+        self._random = random.Random()
+
+    def configure(self, sample_rate):
+        """Включает лог для доли sample_rate статей (0 - выключен)"""
+        self.sample_rate = min(max(float(sample_rate), 0.0), 1.0)
+        self.enabled = self.sample_rate > 0 and self.logger.isEnabledFor(logging.DEBUG)
+
+    def debug(self, message, *args):
+        if not self.enabled:
+            return
+        if self.sample_rate < 1.0 and self._random.random() >= self.sample_rate:
+            return
+        self.logger.debug(message, *args)
+
+
+article_log = ArticleLog(get_logger("articles"))
+
+
+def setup_logging(level=None, article_sample=None):
+    """Настраивает вывод логов приложения в консоль
+
+    Без вызова этой функции сообщения уровня INFO и DEBUG не выводятся
+    (например, в тестах).
+    """
+    if level is None:
+        level = os.environ.get("NEWSCLASSIFY_LOG_LEVEL", "INFO")
+    if article_sample is None:
+        article_sample = os.environ.get("NEWSCLASSIFY_ARTICLE_LOG_SAMPLE", 0)
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+
+    if not root.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        root.addHandler(handler)
+        root.propagate = False
+
+    article_log.configure(article_sample)
+    return root
\ No newline at end of file
@@ -1,10 +1,204 @@
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QPushButton, QFrame, QComboBox,
-                             QSizePolicy)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+                             QSizePolicy, QApplication)
+from PyQt6.QtCore import Qt, QVariantAnimation, pyqtSignal
 from PyQt6.QtGui import QFont
 
-from mock_data_news import mock_data
+from app_logging import get_logger
+from mock_data_news import get_mock_data
+
+
+logger = get_logger("card")
+
+# Общая таблица стилей для всех карточек. Устанавливается в приложение
+# один раз; состояние карточки задается свойствами level и corrected.
+ARTICLE_CARD_STYLE = """
+    ArticleCard {
+        background-color: white;
+        border: 1px solid #dfe6e9;
+        border-radius: 8px;
+        margin: 8px 5px;
+        padding: 15px;
+    }
+    ArticleCard:hover {
+        border: 1px solid #3498db;
+    }
+    ArticleCard QLabel#articleTitle {
+        color: #2c3e50;
+        margin-bottom: 5px;
+    }
+    ArticleCard QLabel#articleMeta {
+        color: #636e72;
+        font-size: 9pt;
+        padding: 5px 8px;
+        background-color: #f8f9fa;
+        border-radius: 5px;
+    }
+    ArticleCard QLabel#articleContent {
+        color: #555;
+        font-size: 10pt;
+        line-height: 1.4;
+        margin: 5px 0;
+        padding: 8px;
+        background-color: #fdfdfd;
+        border-radius: 6px;
+        border-left: 3px solid #3498db;
+    }
+    ArticleCard QLabel#correctionLabel {
+        font-weight: bold;
+        color: #2c3e50;
+        font-size: 10pt;
+    }
+
+    ArticleCard QLabel#topicBadge {
+        color: white;
+        font-weight: bold;
+        font-size: 11pt;
+        padding: 8px 12px;
+        border-radius: 8px;
+    }
+    ArticleCard QLabel#topicBadge[level="high"],
+    ArticleCard QLabel#topicBadge[level="corrected"] {
+        background-color: #27ae60;
+        border: 2px solid rgba(39, 174, 96, 128);
+    }
+    ArticleCard QLabel#topicBadge[level="medium"] {
+        background-color: #f39c12;
+        border: 2px solid rgba(243, 156, 18, 128);
+    }
+    ArticleCard QLabel#topicBadge[level="low"] {
+        background-color: #e74c3c;
+        border: 2px solid rgba(231, 76, 60, 128);
+    }
+
+    ArticleCard QLabel#confidenceBadge {
+        font-size: 13pt;
+        font-weight: bold;
+        padding: 6px 12px 8px 12px;
+        border-radius: 10px;
+        line-height: 1.2;
+    }
+    ArticleCard QLabel#confidenceBadge[level="high"] {
+        color: #27ae60;
+        background-color: rgba(39, 174, 96, 32);
+        border: 2px solid rgba(39, 174, 96, 80);
+    }
+    ArticleCard QLabel#confidenceBadge[level="medium"] {
+        color: #f39c12;
+        background-color: rgba(243, 156, 18, 32);
+        border: 2px solid rgba(243, 156, 18, 80);
+    }
+    ArticleCard QLabel#confidenceBadge[level="low"] {
+        color: #e74c3c;
+        background-color: rgba(231, 76, 60, 32);
+        border: 2px solid rgba(231, 76, 60, 80);
+    }
+    ArticleCard QLabel#confidenceBadge[level="corrected"] {
+        color: #27ae60;
+        background-color: #e8f6f3;
+        border: 2px solid #27ae60;
+    }
+
+    ArticleCard QComboBox#correctionCombo {
+        padding: 6px;
+        border: 1px solid #bdc3c7;
+        border-radius: 4px;
+        background-color: white;
+        font-size: 9pt;
+        color: #2c3e50;
+        min-height: 30px;
+    }
+    ArticleCard QComboBox#correctionCombo:hover {
+        border: 1px solid #3498db;
+    }
+
+    ArticleCard QPushButton#correctButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-size: 7pt;
+        font-weight: bold;
+        min-height: 30px;
+    }
+    ArticleCard QPushButton#correctButton:hover {
+        background-color: #2980b9;
+    }
+    ArticleCard QPushButton#correctButton:disabled {
+        background-color: #bdc3c7;
+        color: #7f8c8d;
+    }
+    ArticleCard QPushButton#correctButton[corrected="true"] {
+        background-color: #27ae60;
+        color: white;
+        font-size: 9pt;
+    }
+"""
+
+_style_installed = False
+
+# Длительность анимации: 20 мс на процент и пауза перед финальным видом
+ANIMATION_STEP_MS = 20
+ANIMATION_HOLD_MS = 500
+
+_animations_enabled = True
+
+
+def set_animations_enabled(enabled):
+    """Включает или отключает анимацию процентов во всех карточках"""
+    global _animations_enabled
+    _animations_enabled = bool(enabled)
+
+
+def animations_enabled():
+    return _animations_enabled
+
+
+@contextmanager
+def animations_disabled():
+    """Отключает анимацию на время массовых операций"""
+    previous = _animations_enabled
+    set_animations_enabled(False)
+    try:
+        yield
+    finally:
+        set_animations_enabled(previous)
+
+
+def install_card_style():
+    """Добавляет стили карточек в таблицу стилей приложения (один раз)"""
+    global _style_installed
+    if _style_installed:
+        return
+
+    app = QApplication.instance()
+    if app is None:
+        return
+
+    app.setStyleSheet(app.styleSheet() + ARTICLE_CARD_STYLE)
+    _style_installed = True
+
+
+def confidence_level(confidence):
+    """Уровень уверенности для свойства level"""
+    if confidence > 0.9:
+        return "high"
+    elif confidence > 0.8:
+        return "medium"
+    return "low"
+
+
+def set_style_property(widget, name, value):
+    """Меняет динамическое свойство и обновляет стиль без разбора CSS"""
+    if widget.property(name) == value:
+        return
+
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
 
 
 class ArticleCard(QFrame):
@@ -13,42 +207,34 @@ class ArticleCard(QFrame):
 
     def __init__(self, article_data):
         super().__init__()
+        install_card_style()
         self.article_data = article_data
         self.is_corrected = False
+        self._animation = None
+        self._animation_percent = None
         self.init_ui()
+        self.bind(article_data)
 
     def init_ui(self):
+        mock_data = get_mock_data()
         self.setMinimumHeight(270)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
-        self.setStyleSheet("""
-            ArticleCard {
-                background-color: white;
-                border: 1px solid #dfe6e9;
-                border-radius: 8px;
-                margin: 8px 5px;
-                padding: 15px;
-            }
-            ArticleCard:hover {
-                border: 1px solid #3498db;
-                box-shadow: 0 2px 8px rgba(52, 152, 219, 0.2);
-            }
-        """)
-
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
         layout.setContentsMargins(15, 15, 15, 15)
 
         # Верхняя строка: заголовок
-        title = QLabel(self.article_data["title"])
+        title = QLabel()
+        title.setObjectName("articleTitle")
         title_font = QFont()
         title_font.setPointSize(12)
         title_font.setBold(True)
         title.setFont(title_font)
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 5px;")
         title.setWordWrap(True)
         title.setMinimumHeight(30)
         layout.addWidget(title)
+        self.title_label = title
 
         # Вторая строка: мета-информация
         meta_container = QWidget()
@@ -58,42 +244,21 @@ class ArticleCard(QFrame):
         meta_layout.setSpacing(8)
 
         # Источник
-        source_label = QLabel(f"📰 {self.article_data['source']}")
-        source_label.setStyleSheet("""
-            color: #636e72;
-            font-size: 9pt;
-            padding: 5px 8px;
-            background-color: #f8f9fa;
-            border-radius: 5px;
-        """)
+        source_label = QLabel()
+        source_label.setObjectName("articleMeta")
         meta_layout.addWidget(source_label)
+        self.source_label = source_label
 
         # Дата
-        date_label = QLabel(f"📅 {self.article_data['date']}")
-        date_label.setStyleSheet("""
-            color: #636e72;
-            font-size: 9pt;
-            padding: 5px 8px;
-            background-color: #f8f9fa;
-            border-radius: 5px;
-        """)
+        date_label = QLabel()
+        date_label.setObjectName("articleMeta")
         meta_layout.addWidget(date_label)
+        self.date_label = date_label
 
         meta_layout.addStretch()
 
         # Тема с индикатором уверенности и ПРОЦЕНТАМИ С ПОДПИСЬЮ
-        confidence = self.article_data["confidence"]
-        confidence_percent = int(confidence * 100)
-
-        if confidence > 0.9:
-            color = "#27ae60"
-            confidence_text = f"{confidence_percent}%\n🎯 Высокая"
-        elif confidence > 0.8:
-            color = "#f39c12"
-            confidence_text = f"{confidence_percent}%\n📊 Средняя"
-        else:
-            color = "#e74c3c"
-            confidence_text = f"{confidence_percent}%\n⚠️ Низкая"
+        # (текст и уровень выставляет update_topic_display)
 
         # Создаем контейнер для темы и уверенности
         topic_container = QWidget()
@@ -103,38 +268,15 @@ class ArticleCard(QFrame):
         topic_layout.setContentsMargins(0, 0, 0, 0)
 
         # Название темы (цветной прямоугольник)
-        self.topic_label = QLabel(self.article_data["predicted_topic"])
-        self.topic_label.setStyleSheet(f"""
-            QLabel {{
-                color: white;
-                font-weight: bold;
-                font-size: 11pt;
-                background-color: {color};
-                padding: 8px 12px;
-                border-radius: 8px;
-                border: 2px solid {color}80;
-                qproperty-alignment: AlignCenter;
-            }}
-        """)
+        self.topic_label = QLabel()
+        self.topic_label.setObjectName("topicBadge")
         self.topic_label.setFixedHeight(34)
         self.topic_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Процент уверенности с подписью - БОЛЬШОЙ прямоугольник
-        self.confidence_label = QLabel(confidence_text)
+        self.confidence_label = QLabel()
+        self.confidence_label.setObjectName("confidenceBadge")
         self.confidence_label.setFixedHeight(60)
-        self.confidence_label.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-size: 13pt;
-                font-weight: bold;
-                padding: 6px 12px 8px 12px;
-                background-color: {color}20;
-                border-radius: 10px;
-                border: 2px solid {color}50;
-                qproperty-alignment: AlignCenter;
-                line-height: 1.2;
-            }}
-        """)
         self.confidence_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         topic_layout.addWidget(self.topic_label)
@@ -145,24 +287,12 @@ class ArticleCard(QFrame):
         layout.addWidget(meta_container)
 
         # Третья строка: контент
-        content_preview = self.article_data["content"]
-        if len(content_preview) > 140:
-            content_preview = content_preview[:140] + "..."
-
-        content = QLabel(content_preview)
+        content = QLabel()
+        content.setObjectName("articleContent")
         content.setWordWrap(True)
-        content.setStyleSheet("""
-            color: #555;
-            font-size: 10pt;
-            line-height: 1.4;
-            margin: 5px 0;
-            padding: 8px;
-            background-color: #fdfdfd;
-            border-radius: 6px;
-            border-left: 3px solid #3498db;
-        """)
         content.setFixedHeight(55)
         layout.addWidget(content)
+        self.content_label = content
 
         # Четвертая строка: панель коррекции
         correction_panel = QWidget()
@@ -173,125 +303,103 @@ class ArticleCard(QFrame):
 
         # Метка
         correction_label = QLabel("Исправить:")
-        correction_label.setStyleSheet("font-weight: bold; color: #2c3e50; font-size: 10pt;")
+        correction_label.setObjectName("correctionLabel")
         correction_label.setFixedWidth(70)
         correction_layout.addWidget(correction_label)
 
         # Комбобокс
         self.correction_combo = QComboBox()
+        self.correction_combo.setObjectName("correctionCombo")
         self.correction_combo.addItem("-- Выберите --")
         self.correction_combo.addItems(mock_data.available_topics)
-        self.correction_combo.setStyleSheet("""
-            QComboBox {
-                padding: 6px;
-                border: 1px solid #bdc3c7;
-                border-radius: 4px;
-                background-color: white;
-                font-size: 9pt;
-                color: #2c3e50;
-                min-height: 30px;
-            }
-            QComboBox:hover {
-                border: 1px solid #3498db;
-            }
-        """)
         self.correction_combo.setFixedWidth(120)
         self.correction_combo.currentIndexChanged.connect(self.on_combo_changed)
         correction_layout.addWidget(self.correction_combo)
 
         # Кнопка
-        self.correct_btn = QPushButton("✅ Применить")
-        self.correct_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 7pt;
-                font-weight: bold;
-                min-height: 30px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """)
+        self.correct_btn = QPushButton()
+        self.correct_btn.setObjectName("correctButton")
         self.correct_btn.setFixedWidth(90)
-        self.correct_btn.setEnabled(False)
         self.correct_btn.clicked.connect(self.on_correct_click)
         correction_layout.addWidget(self.correct_btn)
 
         correction_layout.addStretch()
         layout.addWidget(correction_panel)
 
+    def bind(self, article_data):
+        """Показывает в карточке другую статью (карточки переиспользуются в ленте)"""
+        self.article_data = article_data
+        self.is_corrected = False
+
+        # Останавливаем анимацию предыдущей статьи
+        self.stop_animation()
+
+        self.title_label.setText(article_data["title"])
+        self.source_label.setText(f"📰 {article_data['source']}")
+        self.date_label.setText(f"📅 {article_data['date']}")
+
+        content_preview = article_data["content"]
+        if len(content_preview) > 140:
+            content_preview = content_preview[:140] + "..."
+        self.content_label.setText(content_preview)
+
+        self.update_topic_display()
+
+        # Сбрасываем панель коррекции
+        self.correction_combo.blockSignals(True)
+        self.correction_combo.setCurrentIndex(0)
+        self.correction_combo.blockSignals(False)
+        self.correction_combo.setEnabled(True)
+
+        self.correct_btn.setText("✅ Применить")
+        set_style_property(self.correct_btn, "corrected", False)
+        self.correct_btn.setEnabled(False)
+
+    def stop_animation(self):
+        """Прерывает анимацию процентов"""
+        if self._animation is not None:
+            self._animation.stop()
+        self._animation_percent = None
+
     def update_topic_display(self):
         """Обновляет отображение темы и confidence с подписью"""
         confidence = self.article_data["confidence"]
         confidence_percent = int(confidence * 100)
         topic = self.article_data["predicted_topic"]
 
-        # Определяем цвет на основе confidence
+        # Уровень (и цвет) на основе confidence
         if self.is_corrected or confidence == 1.0:
-            color = "#27ae60"
+            level = "corrected"
             confidence_text = "100%\n✅ Исправлено"
-        elif confidence > 0.9:
-            color = "#27ae60"
-            confidence_text = f"{confidence_percent}%\n🎯 Высокая"
-        elif confidence > 0.8:
-            color = "#f39c12"
-            confidence_text = f"{confidence_percent}%\n📊 Средняя"
         else:
-            color = "#e74c3c"
-            confidence_text = f"{confidence_percent}%\n⚠️ Низкая"
+            level = confidence_level(confidence)
+            if level == "high":
+                confidence_text = f"{confidence_percent}%\n🎯 Высокая"
+            elif level == "medium":
+                confidence_text = f"{confidence_percent}%\n📊 Средняя"
+            else:
+                confidence_text = f"{confidence_percent}%\n⚠️ Низкая"
 
         # Обновляем тему
         self.topic_label.setText(topic)
-        self.topic_label.setStyleSheet(f"""
-            QLabel {{
-                color: white;
-                font-weight: bold;
-                font-size: 11pt;
-                background-color: {color};
-                padding: 8px 12px;
-                border-radius: 8px;
-                border: 2px solid {color}80;
-                qproperty-alignment: AlignCenter;
-            }}
-        """)
+        set_style_property(self.topic_label, "level", level)
 
         # Обновляем confidence с подписью
         self.confidence_label.setText(confidence_text)
-        self.confidence_label.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-size: 13pt;
-                font-weight: bold;
-                padding: 6px 12px 8px 12px;
-                background-color: {color}20;
-                border-radius: 10px;
-                border: 2px solid {color}50;
-                qproperty-alignment: AlignCenter;
-                line-height: 1.2;
-            }}
-        """)
+        set_style_property(self.confidence_label, "level", level)
 
     def on_combo_changed(self, index):
         self.correct_btn.setEnabled(index > 0)
 
     def on_correct_click(self):
+        mock_data = get_mock_data()
         if self.is_corrected:
             return
 
         selected_topic = self.correction_combo.currentText()
         if selected_topic and selected_topic != "-- Выберите --":
-            # Сохраняем старые значения для анимации
-            old_confidence = self.article_data["confidence"]
-            old_percent = int(old_confidence * 100)
-            old_color = self.get_confidence_color(old_confidence)
+            # Сохраняем старое значение для анимации
+            old_percent = int(self.article_data["confidence"] * 100)
 
             # Корректируем статью в данных
             success = mock_data.correct_article_topic(
@@ -302,17 +410,7 @@ class ArticleCard(QFrame):
             if success:
                 self.is_corrected = True
                 self.correct_btn.setText("✅ Исправлено")
-                self.correct_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #27ae60;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        padding: 6px 12px;
-                        font-size: 9pt;
-                        font-weight: bold;
-                    }
-                """)
+                set_style_property(self.correct_btn, "corrected", True)
                 self.correct_btn.setEnabled(False)
                 self.correction_combo.setEnabled(False)
 
@@ -325,12 +423,12 @@ class ArticleCard(QFrame):
                 self.update_topic_display()
 
                 # Анимация изменения процентов (от старого к 100%)
-                self.animate_percentage_increase(old_percent, 100, old_color, "#27ae60")
+                self.animate_percentage_increase(old_percent, 100)
 
                 # Сигнализируем об исправлении
                 self.article_corrected.emit(self.article_data["id"])
 
-                print(f"📝 Коррекция сохранена: статья {self.article_data['id']} → {selected_topic}")
+                logger.debug("📝 Коррекция сохранена: статья %s → %s", self.article_data['id'], selected_topic)
 
     def get_confidence_color(self, confidence):
         """Возвращает цвет по уровню уверенности"""
@@ -341,89 +439,58 @@ class ArticleCard(QFrame):
         else:
             return "#e74c3c"
 
-    def animate_percentage_increase(self, start_percent, end_percent,
-                                    start_color, end_color):
-        """Анимация плавного увеличения процентов"""
-        # Цветовые переходы
-        start_r = int(start_color[1:3], 16)
-        start_g = int(start_color[3:5], 16)
-        start_b = int(start_color[5:7], 16)
-
-        end_r = int(end_color[1:3], 16)
-        end_g = int(end_color[3:5], 16)
-        end_b = int(end_color[5:7], 16)
-
-        # Начальный текст
-        current_percent = start_percent
-
-        # Определяем текст для анимации
-        if start_percent > 0.9:
-            base_text = "🎯 Высокая"
-        elif start_percent > 0.8:
-            base_text = "📊 Средняя"
-        else:
-            base_text = "⚠️ Низкая"
-
-        self.confidence_label.setText(f"{current_percent}%\n{base_text}")
-
-        # Анимация
-        step = 1
-        delay = 20
-        total_steps = end_percent - start_percent
-
-        for i in range(total_steps + 1):
-            current_percent = start_percent + i
+    def animate_percentage_increase(self, start_percent, end_percent):
+        """Анимация плавного увеличения процентов
 
-            # Плавный переход цвета
-            if i < total_steps:
-                progress = i / total_steps
-                current_r = int(start_r + (end_r - start_r) * progress)
-                current_g = int(start_g + (end_g - start_g) * progress)
-                current_b = int(start_b + (end_b - start_b) * progress)
-                current_color = f"#{current_r:02x}{current_g:02x}{current_b:02x}"
-            else:
-                current_color = end_color
-
-            # Запланировать обновление
-            QTimer.singleShot(i * delay,
-                              lambda p=current_percent, c=current_color, final=(i == total_steps):
-                              self.update_animation_label(p, c, final))
-
-        # Финальный вид
-        QTimer.singleShot(total_steps * delay + 500,
-                          lambda: self.update_topic_display())
+        Одна QVariantAnimation на карточку: повторный запуск или
+        stop_animation() прерывают предыдущую анимацию.
+        """
+        self.stop_animation()
+        if not _animations_enabled or start_percent >= end_percent:
+            self.update_topic_display()
+            return
 
-    def update_animation_label(self, percent, color, is_final=False):
-        """Обновляет текст и цвет метки процентов с подписью"""
+        if self._animation is None:
+            self._animation = QVariantAnimation(self)
+            self._animation.valueChanged.connect(self._on_animation_value)
+            self._animation.finished.connect(self.update_topic_display)
+
+        # Проценты растут, затем держим 100% до финального вида
+        steps_ms = (end_percent - start_percent) * ANIMATION_STEP_MS
+        duration = steps_ms + ANIMATION_HOLD_MS
+        self._animation.blockSignals(True)
+        self._animation.setDuration(duration)
+        self._animation.setKeyValues([(0.0, start_percent),
+                                      (steps_ms / duration, end_percent),
+                                      (1.0, end_percent)])
+        self._animation.blockSignals(False)
+
+        self.update_animation_label(start_percent)
+        self._animation.start()
+
+    def _on_animation_value(self, value):
+        """Обновляет метку только при смене целого процента"""
+        percent = int(value)
+        if percent != self._animation_percent:
+            self.update_animation_label(percent)
+
+    def update_animation_label(self, percent):
+        """Обновляет текст и уровень метки процентов с подписью
+
+        Цвет меняется по уровням (low → medium → high), поэтому стиль
+        пересчитывается лишь при смене уровня, а не на каждом кадре.
+        """
         if percent < 100:
             # Во время анимации показываем "Исправление..."
             if percent > 95:
                 text = f"{percent}%\n📈 Почти готово"
             else:
                 text = f"{percent}%\n📈 Исправление..."
-            font_size = "12pt"
-            padding = "6px 12px 8px 12px"
-            background_color = f"{color}20"
-            border_color = f"{color}50"
+            level = confidence_level(percent / 100)
         else:
             text = "100%\n✅ Исправлено"
-            color = "#27ae60"
-            font_size = "13pt"
-            padding = "6px 12px 8px 12px"
-            background_color = "#e8f6f3"
-            border_color = "#27ae60"
+            level = "corrected"
 
+        self._animation_percent = percent
         self.confidence_label.setText(text)
-        self.confidence_label.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-size: {font_size};
-                font-weight: bold;
-                padding: {padding};
-                background-color: {background_color};
-                border-radius: 10px;
-                border: 2px solid {border_color};
-                qproperty-alignment: AlignCenter;
-                line-height: 1.2;
-            }}
-        """)
\ No newline at end of file
+        set_style_property(self.confidence_label, "level", level)
\ No newline at end of file
@@ -0,0 +1,294 @@
+"""
+Модель и делегат ленты новостей
+
+Лента строится на QListView: модель хранит только ссылки на статьи,
+а делегат рисует видимые строки. Полноценный ArticleCard создается
+лишь как редактор для строки под курсором.
+"""
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtCore import (Qt, QAbstractListModel, QModelIndex, QRect,
+                          QSize, pyqtSignal)
+from PyQt6.QtGui import QColor, QFont, QPen, QFontMetrics
+
+from article_card import ArticleCard
+from mock_data_news import ArticleCursor
+
+
+# Роль для получения словаря статьи из модели
+ARTICLE_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Высота строки совпадает с высотой ArticleCard (270 + отступы)
+ROW_HEIGHT = 290
+
+# Сколько статей подгружается за один раз
+PAGE_SIZE = 50
+
+# Сколько свободных карточек-редакторов держит делегат
+CARD_POOL_SIZE = 8
+
+
+def confidence_style(article):
+    """Цвет и подпись уровня уверенности, как в ArticleCard"""
+    confidence = article["confidence"]
+    percent = int(confidence * 100)
+
+    if article.get("true_topic") or confidence == 1.0:
+        return "#27ae60", "100% ✅ Исправлено"
+    elif confidence > 0.9:
+        return "#27ae60", f"{percent}% 🎯 Высокая"
+    elif confidence > 0.8:
+        return "#f39c12", f"{percent}% 📊 Средняя"
+    return "#e74c3c", f"{percent}% ⚠️ Низкая"
+
+
+class ArticleListModel(QAbstractListModel):
+    """Список статей для ленты (новые статьи сверху)
+
+    Статьи подгружаются страницами из ArticleCursor: QListView сам
+    вызывает fetchMore, когда прокрутка доходит до конца списка.
+    """
+
+    def __init__(self, parent=None, page_size=PAGE_SIZE):
+        super().__init__(parent)
+        self.page_size = page_size
+        self._cursor = None
+        self._articles = []
+        # id -> порядковый ключ; строка = ключ - self._base
+        # (при добавлении статей сверху сдвигается только _base)
+        self._rows = {}
+        self._base = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._articles)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        article = self._articles[index.row()]
+        if role == ARTICLE_ROLE:
+            return article
+        elif role == Qt.ItemDataRole.DisplayRole:
+            return article["title"]
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            return article["content"]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsEditable
+
+    def set_cursor(self, cursor):
+        """Заменяет содержимое ленты и загружает первую страницу"""
+        self.beginResetModel()
+        self._cursor = cursor
+        self._articles = []
+        self._rows = {}
+        self._base = 0
+        self.endResetModel()
+        self.fetchMore()
+
+    def set_articles(self, articles):
+        """Заменяет содержимое ленты (последняя статья показывается первой)"""
+        self.set_cursor(ArticleCursor(articles))
+
+    @property
+    def total(self):
+        """Всего статей в ленте, включая еще не загруженные"""
+        if self._cursor is None:
+            return len(self._articles)
+        return self._cursor.total + len(self._articles) - self._cursor.fetched
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._cursor is None:
+            return False
+        return self._cursor.has_more()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+
+        page = self._cursor.fetch(self.page_size)
+        first = len(self._articles)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        for row, article in enumerate(page, first):
+            self._rows[article["id"]] = self._base + row
+        self._articles.extend(page)
+        self.endInsertRows()
+
+    def prepend_articles(self, articles):
+        """Добавляет новые статьи в начало ленты (последняя - самая верхняя)"""
+        if not articles:
+            return
+
+        new_rows = articles[::-1]
+        self.beginInsertRows(QModelIndex(), 0, len(new_rows) - 1)
+        self._base -= len(new_rows)
+        for row, article in enumerate(new_rows):
+            self._rows[article["id"]] = self._base + row
+        self._articles[:0] = new_rows
+        self.endInsertRows()
+
+    def article(self, row):
+        """Возвращает статью по номеру строки"""
+        return self._articles[row]
+
+    def refresh_article(self, article_id):
+        """Перерисовывает строку после изменения статьи"""
+        key = self._rows.get(article_id)
+        if key is None:
+            return False
+
+        index = self.index(key - self._base)
+        self.dataChanged.emit(index, index)
+        return True
+
+
+class ArticleDelegate(QStyledItemDelegate):
+    """Рисует карточку статьи и создает ArticleCard для редактирования"""
+
+    article_corrected = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Закрытые редакторы не удаляются, а ждут следующей строки
+        self._card_pool = []
+
+        self.title_font = QFont()
+        self.title_font.setPointSize(12)
+        self.title_font.setBold(True)
+
+        self.meta_font = QFont()
+        self.meta_font.setPointSize(9)
+
+        self.badge_font = QFont()
+        self.badge_font.setPointSize(10)
+        self.badge_font.setBold(True)
+
+        self.content_font = QFont()
+        self.content_font.setPointSize(10)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        # Берем словарь напрямую: через data() Qt вернул бы копию
+        article = index.model().article(index.row())
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+
+        # Рамка карточки (отступы как у ArticleCard)
+        card = option.rect.adjusted(5, 8, -5, -8)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setPen(QPen(QColor("#3498db" if hovered else "#dfe6e9"), 1))
+        painter.setBrush(QColor("white"))
+        painter.drawRoundedRect(card, 8, 8)
+
+        inner = card.adjusted(15, 15, -15, -15)
+        color, confidence_text = confidence_style(article)
+
+        # Заголовок
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#2c3e50"))
+        title_rect = QRect(inner.left(), inner.top(), inner.width(), 40)
+        painter.drawText(title_rect, Qt.TextFlag.TextWordWrap, article["title"])
+
+        # Источник и дата
+        painter.setFont(self.meta_font)
+        painter.setPen(QColor("#636e72"))
+        meta_top = title_rect.bottom() + 10
+        metrics = QFontMetrics(self.meta_font)
+        x = inner.left()
+        for text in (f"📰 {article['source']}", f"📅 {article['date']}"):
+            chip = QRect(x, meta_top, metrics.horizontalAdvance(text) + 16, 26)
+            painter.setBrush(QColor("#f8f9fa"))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(chip, 5, 5)
+            painter.setPen(QColor("#636e72"))
+            painter.drawText(chip, Qt.AlignmentFlag.AlignCenter, text)
+            x = chip.right() + 8
+
+        # Тема и уверенность
+        badge = QRect(inner.right() - 140, meta_top, 140, 34)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawRoundedRect(badge, 8, 8)
+        painter.setFont(self.badge_font)
+        painter.setPen(QColor("white"))
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, article["predicted_topic"])
+
+        confidence_rect = QRect(badge.left(), badge.bottom() + 4, 140, 30)
+        background = QColor(color)
+        background.setAlpha(32)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(confidence_rect, 10, 10)
+        painter.setPen(QColor(color))
+        painter.drawText(confidence_rect, Qt.AlignmentFlag.AlignCenter, confidence_text)
+
+        # Превью содержания
+        content_preview = article["content"]
+        if len(content_preview) > 140:
+            content_preview = content_preview[:140] + "..."
+
+        content_rect = QRect(inner.left(), confidence_rect.bottom() + 14, inner.width(), 55)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#fdfdfd"))
+        painter.drawRoundedRect(content_rect, 6, 6)
+        painter.setBrush(QColor("#3498db"))
+        painter.drawRect(QRect(content_rect.left(), content_rect.top(), 3, content_rect.height()))
+        painter.setFont(self.content_font)
+        painter.setPen(QColor("#555555"))
+        painter.drawText(content_rect.adjusted(10, 6, -8, -6),
+                         Qt.TextFlag.TextWordWrap, content_preview)
+
+        # Подсказка вместо панели коррекции
+        painter.setFont(self.meta_font)
+        painter.setPen(QColor("#95a5a6"))
+        hint_rect = QRect(inner.left(), content_rect.bottom() + 10, inner.width(), 30)
+        painter.drawText(hint_rect, Qt.AlignmentFlag.AlignVCenter,
+                         "✏️ Наведите курсор, чтобы исправить тему")
+
+        painter.restore()
+
+    def createEditor(self, parent, option, index):
+        article = index.model().article(index.row())
+
+        if self._card_pool:
+            card = self._card_pool.pop()
+            card.bind(article)
+        else:
+            card = ArticleCard(article)
+            card.article_corrected.connect(self.article_corrected)
+
+        if card.parent() is not parent:
+            card.setParent(parent)
+        card.show()
+        return card
+
+    def destroyEditor(self, editor, index):
+        """Возвращает карточку в пул вместо удаления"""
+        if len(self._card_pool) >= CARD_POOL_SIZE:
+            super().destroyEditor(editor, index)
+            return
+
+        editor.hide()
+        editor.stop_animation()
+        self._card_pool.append(editor)
+
+    def setEditorData(self, editor, index):
+        # Карточка читает данные статьи сама при создании
+        pass
+
+    def setModelData(self, editor, model, index):
+        # Коррекция сохраняется в MockNewsData самой карточкой
+        pass
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Проверка бюджета времени импорта при запуске NewsClassify AI
+
+    python check_startup_time.py                  # news_window, бюджет 400 мс
+    python check_startup_time.py --budget-ms 300 --repeat 5
+
+Запускает `python -X importtime -c "import <модуль>"` и суммирует время
+импорта. Завершается с кодом 1, если бюджет превышен или при запуске
+загружаются модули, которые должны подгружаться только по требованию
+(numpy, pandas, openpyxl, pyarrow).
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+DEFAULT_MODULE = "news_window"
+DEFAULT_BUDGET_MS = 400
+
+# Эти модули нужны только для пакетной классификации и экспорта
+# и не должны грузиться при запуске
+DEFERRED_MODULES = ("numpy", "pandas", "openpyxl", "pyarrow")
+
+
+def measure_imports(module):
+    """Импортирует модуль в отдельном процессе
+
+    Возвращает (общее время в мс, {модуль: накопленное время в мс}).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Не удалось импортировать {module}:\n{result.stderr[-2000:]}")
+
+    total_us = 0
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # строка заголовка
+
+        name = name[1:]
+        cumulative_us = int(cumulative)
+        modules[name.strip()] = cumulative_us / 1000
+
+        # Модули верхнего уровня идут без отступа
+        if not name.startswith(" "):
+            total_us += cumulative_us
+
+    return total_us / 1000, modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Проверка времени импорта при запуске")
+    parser.add_argument("--module", default=DEFAULT_MODULE,
+                        help="модуль, с которого начинается запуск")
+    parser.add_argument("--budget-ms", type=float,
+                        default=float(os.environ.get("NEWSCLASSIFY_STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS)),
+                        help="допустимое время импорта, мс")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="число замеров (берется лучший)")
+    parser.add_argument("--top", type=int, default=10,
+                        help="сколько самых медленных модулей показать")
+    args = parser.parse_args(argv)
+
+    measurements = [measure_imports(args.module) for _ in range(max(1, args.repeat))]
+    total_ms, modules = min(measurements, key=lambda m: m[0])
+
+    print(f"⏱️ Импорт {args.module}: {total_ms:.0f} мс (бюджет {args.budget_ms:.0f} мс)")
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]
+    for name, ms in slowest:
+        print(f"   {ms:8.1f} мс  {name}")
+
+    ok = True
+    loaded = [name for name in DEFERRED_MODULES if name in modules]
+    if loaded:
+        print(f"❌ При запуске загружаются модули экспорта: {', '.join(loaded)}")
+        ok = False
+
+    if total_ms > args.budget_ms:
+        print(f"❌ Бюджет превышен на {total_ms - args.budget_ms:.0f} мс")
+        ok = False
+
+    if ok:
+        print("✅ Время запуска в пределах бюджета")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Многопроцессный пул классификации для массовой переоценки статей
+
+Словари и веса модели передаются в каждый процесс один раз при запуске,
+дальше в процессы уходят только порции статей (title, content).
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+
+from mock_data_news import MockMLClassifier
+
+
+# Классификатор процесса-обработчика (создается в _init_worker)
+_worker_classifier = None
+
+
+def _init_worker(state):
+    """Инициализация процесса: восстанавливаем модель из снимка"""
+    global _worker_classifier
+    _worker_classifier = MockMLClassifier.from_state(state)
+
+
+def _classify_chunk(pairs):
+    """Классифицирует одну порцию статей в процессе пула"""
+    topics, confidences = _worker_classifier.predict_topics(pairs)
+    return topics.tolist(), confidences.tolist()
+
+
+class ClassificationPool:
+    """Пул процессов для классификации больших объемов статей
+
+    Используется как контекстный менеджер:
+
+        with ClassificationPool(classifier, workers=8) as pool:
+            for topic, confidence in pool.classify(pairs):
+                ...
+    """
+
+    def __init__(self, classifier, workers=None, chunk_size=2000):
+        if chunk_size < 1:
+            raise ValueError("chunk_size должен быть положительным")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        # Модель фиксируется на момент создания пула
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(classifier.get_state(),)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Останавливает процессы пула"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _chunks(self, pairs):
+        iterator = iter(pairs)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def classify(self, pairs):
+        """Генератор (тема, confidence) в порядке входных пар (title, content)
+
+        Порции отправляются потоком: одновременно в работе не больше
+        двух порций на процесс, поэтому память не зависит от объема входа.
+        """
+        pending = deque()
+        max_pending = self.workers * 2
+
+        for chunk in self._chunks(pairs):
+            pending.append(self._executor.submit(_classify_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from zip(*pending.popleft().result())
+
+        while pending:
+            yield from zip(*pending.popleft().result())
+
+    def predict_topics(self, pairs):
+        """То же, что MockMLClassifier.predict_topics, но в процессах пула"""
+        topics, confidences = [], []
+        for topic, confidence in self.classify(pairs):
+            topics.append(topic)
+            confidences.append(confidence)
+        return np.array(topics, dtype=object), np.array(confidences, dtype=float)
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""
+Фоновая классификация статей для NewsClassify AI
+
+Статьи оцениваются в QThreadPool пачками, результаты возвращаются в
+GUI-поток через сигналы. Рабочий поток использует собственную копию
+модели (MockMLClassifier.from_state), поэтому не трогает кэши
+и SQLite-соединение основного классификатора.
+"""
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from app_logging import get_logger
+from mock_data_news import MockMLClassifier
+
+
+logger = get_logger("classification")
+
+
+class _TaskSignals(QObject):
+    """Сигналы одной задачи (QRunnable не может иметь своих сигналов)"""
+    batch_ready = pyqtSignal(int, list)
+    finished = pyqtSignal(int, bool)
+    failed = pyqtSignal(int, str)
+
+
+class ClassificationTask(QRunnable):
+    """Классифицирует список статей пачками в потоке пула"""
+
+    def __init__(self, task_id, state, articles, batch_size):
+        super().__init__()
+        self.task_id = task_id
+        self.state = state
+        self.articles = articles
+        self.batch_size = batch_size
+        self.cancelled = False
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            classifier = MockMLClassifier.from_state(self.state)
+
+            for start in range(0, len(self.articles), self.batch_size):
+                if self.cancelled:
+                    break
+
+                batch = self.articles[start:start + self.batch_size]
+                pairs = [(a["title"], a["content"]) for a in batch]
+                topics, confidences = classifier.predict_topics(pairs)
+
+                classified = []
+                for article, topic, confidence in zip(batch, topics.tolist(), confidences.tolist()):
+                    classified.append(dict(article,
+                                           predicted_topic=topic,
+                                           confidence=confidence,
+                                           true_topic=article.get("true_topic")))
+                self.signals.batch_ready.emit(self.task_id, classified)
+
+            self.signals.finished.emit(self.task_id, self.cancelled)
+        except Exception as e:
+            self.signals.failed.emit(self.task_id, str(e))
+
+
+class ClassificationService(QObject):
+    """Принимает пачки статей и добавляет их в MockNewsData без блокировки GUI
+
+    Сигналы:
+        progress(done, total)   - сколько статей задачи уже обработано
+        articles_added(list)    - статьи, только что добавленные в данные
+        finished(count)         - задача завершена, count статей добавлено
+        failed(message)         - ошибка в рабочем потоке
+    """
+
+    progress = pyqtSignal(int, int)
+    articles_added = pyqtSignal(list)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, news_data, parent=None, batch_size=500, pool=None):
+        super().__init__(parent)
+        self.news_data = news_data
+        self.batch_size = batch_size
+        self.pool = pool or QThreadPool.globalInstance()
+        self._tasks = {}
+        self._next_task_id = 1
+
+    def submit(self, articles):
+        """Ставит статьи в очередь на классификацию, возвращает id задачи
+
+        Статьи без id получают его при добавлении в данные.
+        """
+        articles = list(articles)
+        task_id = self._next_task_id
+        self._next_task_id += 1
+
+        # Снимок модели: коррекции после запуска на задачу не влияют
+        task = ClassificationTask(task_id, self.news_data.ml_classifier.get_state(),
+                                  articles, self.batch_size)
+        task.signals.batch_ready.connect(self._on_batch_ready)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+
+        self._tasks[task_id] = {"task": task, "total": len(articles), "done": 0}
+        self.pool.start(task)
+        logger.info("🧵 Задача классификации %d: %d статей", task_id, len(articles))
+        return task_id
+
+    def cancel(self, task_id=None):
+        """Останавливает задачу (или все задачи) после текущей пачки"""
+        for tid, info in self._tasks.items():
+            if task_id is None or tid == task_id:
+                info["task"].cancelled = True
+
+    def is_busy(self):
+        return bool(self._tasks)
+
+    def wait(self, msecs=-1):
+        """Ждет завершения потоков пула (для тестов и выхода из приложения)"""
+        return self.pool.waitForDone(msecs)
+
+    def _on_batch_ready(self, task_id, articles):
+        info = self._tasks.get(task_id)
+        if info is None:
+            return
+
+        # Статьи без id или с уже занятым id получают новый
+        used_ids, pending = set(), []
+        for article in articles:
+            article_id = article.get("id")
+            if (article_id is None or article_id in used_ids
+                    or self.news_data.get_article(article_id) is not None):
+                pending.append(article)
+            else:
+                used_ids.add(article_id)
+
+        if pending:
+            next_id = max(max(used_ids, default=0) + 1, self.news_data.next_article_id())
+            for article in pending:
+                article["id"] = next_id
+                next_id += 1
+
+        try:
+            self.news_data.add_articles(articles)
+        except Exception as e:
+            # Исключение в слоте Qt завершило бы приложение
+            info["task"].cancelled = True
+            self._on_failed(task_id, str(e))
+            return
+
+        info["done"] += len(articles)
+
+        self.articles_added.emit(articles)
+        self.progress.emit(info["done"], info["total"])
+
+    def _on_finished(self, task_id, cancelled):
+        info = self._tasks.pop(task_id, None)
+        if info is None:
+            return
+
+        state = "остановлена" if cancelled else "завершена"
+        logger.info("✅ Задача классификации %d %s: добавлено %d статей", task_id, state, info['done'])
+        self.finished.emit(info["done"])
+
+    def _on_failed(self, task_id, message):
+        self._tasks.pop(task_id, None)
+        logger.error("❌ Ошибка фоновой классификации: %s", message)
+        self.failed.emit(message)
\ No newline at end of file
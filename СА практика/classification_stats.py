@@ -0,0 +1,93 @@
+"""
+Инкрементальная статистика классификации для NewsClassify AI
+
+Счетчики обновляются за O(1) при добавлении, коррекции и удалении
+статьи, поэтому сводка и распределение по темам не требуют
+повторного прохода по всем статьям.
+"""
+
+
+def confidence_level(confidence):
+    """Группа уверенности: high (>90%), medium (80-90%) или low (<80%)"""
+    if confidence > 0.9:
+        return "high"
+    elif confidence >= 0.8:
+        return "medium"
+    return "low"
+
+
+class ClassificationStats:
+    """Накопительные счетчики по всем статьям и по каждой теме"""
+
+    def __init__(self):
+        # Словарь в прежнем формате classification_stats
+        self.stats = {
+            "precision": 0.87,
+            "recall": 0.82,
+            "f1_score": 0.85,
+            "total_articles": 0,
+            "corrected_count": 0,
+            "high_confidence": 0,
+            "medium_confidence": 0,
+            "low_confidence": 0,
+            "avg_confidence": 0
+        }
+        self._confidence_sum = 0.0
+        self._topics = {}
+
+    def reset(self):
+        """Обнуляет счетчики статей (коррекции и точность сохраняются)"""
+        for key in ("total_articles", "high_confidence", "medium_confidence", "low_confidence"):
+            self.stats[key] = 0
+        self.stats["avg_confidence"] = 0
+        self._confidence_sum = 0.0
+        self._topics = {}
+
+    def _update(self, topic, confidence, sign):
+        level = confidence_level(confidence)
+        stats = self.stats
+        stats["total_articles"] += sign
+        stats[f"{level}_confidence"] += sign
+
+        self._confidence_sum += sign * confidence
+        if stats["total_articles"] > 0:
+            stats["avg_confidence"] = self._confidence_sum / stats["total_articles"]
+        else:
+            self._confidence_sum = 0.0
+            stats["avg_confidence"] = 0
+
+        histogram = self._topics.get(topic)
+        if histogram is None:
+            histogram = self._topics[topic] = {"count": 0, "sum": 0.0,
+                                               "high": 0, "medium": 0, "low": 0}
+        histogram["count"] += sign
+        histogram["sum"] += sign * confidence
+        histogram[level] += sign
+        if histogram["count"] == 0:
+            del self._topics[topic]
+
+    def add(self, topic, confidence):
+        """Учитывает новую статью"""
+        self._update(topic, confidence, 1)
+
+    def remove(self, topic, confidence):
+        """Убирает удаленную статью"""
+        self._update(topic, confidence, -1)
+
+    def change(self, old_topic, old_confidence, new_topic, new_confidence):
+        """Учитывает смену темы или confidence у статьи"""
+        self._update(old_topic, old_confidence, -1)
+        self._update(new_topic, new_confidence, 1)
+
+    def topic_summary(self, topic):
+        """Сводка по теме: число статей, средний confidence и группы"""
+        histogram = self._topics.get(topic)
+        if histogram is None:
+            return {"count": 0, "avg_confidence": 0, "high": 0, "medium": 0, "low": 0}
+        return {
+            "count": histogram["count"],
+            "avg_confidence": histogram["sum"] / histogram["count"],
+            "high": histogram["high"],
+            "medium": histogram["medium"],
+            "low": histogram["low"]
+        }
\ No newline at end of file
@@ -4,59 +4,475 @@
 
 import json
 import csv
-import pandas as pd
+import importlib.util
+import shutil
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 import os
 
 
+# Поля статьи в файлах экспорта
+ARTICLE_FIELDS = ['id', 'title', 'content', 'source', 'date',
+                  'predicted_topic', 'confidence', 'true_topic', 'is_corrected']
+
+# Как часто (в статьях) writer сообщает о прогрессе
+PROGRESS_EVERY = 500
+
+# Столбцы листа Excel и сколько строк смотреть при подборе их ширины
+EXCEL_COLUMNS = ['ID', 'Заголовок', 'Содержание', 'Источник', 'Дата',
+                 'Предсказанная тема', 'Уверенность (%)', 'Исправленная тема', 'Исправлена']
+EXCEL_WIDTH_SAMPLE = 1000
+
+# Столбцы файла Parquet и число статей в одной группе строк
+PARQUET_COLUMNS = ['id', 'title', 'content', 'source', 'date',
+                   'predicted_topic', 'confidence', 'true_topic']
+PARQUET_BATCH_SIZE = 10000
+
+
+class ExportCancelled(Exception):
+    """Экспорт остановлен пользователем"""
+
+
+def article_record(article):
+    """Словарь статьи в формате экспорта"""
+    return {
+        "id": article["id"],
+        "title": article["title"],
+        "content": article["content"],
+        "source": article["source"],
+        "date": article["date"],
+        "predicted_topic": article["predicted_topic"],
+        "confidence": article["confidence"],
+        "true_topic": article.get("true_topic", ""),
+        "is_corrected": article.get("true_topic") is not None
+    }
+
+
+def iter_article_records(articles):
+    """Записи экспорта по одной, без копии всего списка"""
+    for article in articles:
+        yield article_record(article)
+
+
+def track_progress(items, progress=None, every=PROGRESS_EVERY):
+    """Передает элементы дальше, вызывая progress(сделано) каждые every штук
+
+    Если progress вернет False, выбрасывается ExportCancelled.
+    """
+    if progress is None:
+        yield from items
+        return
+
+    done = 0
+    for item in items:
+        yield item
+        done += 1
+        if done % every == 0 and progress(done) is False:
+            raise ExportCancelled()
+    progress(done)
+
+
+@contextmanager
+def atomic_path(filename):
+    """Временный путь рядом с filename; при успехе файл заменяет filename
+
+    При ошибке или отмене временный файл удаляется, а прежний filename
+    остается нетронутым.
+    """
+    folder = os.path.dirname(os.path.abspath(filename))
+    fd, temp_path = tempfile.mkstemp(dir=folder, prefix=".export_",
+                                     suffix=os.path.splitext(filename)[1])
+    os.close(fd)
+    try:
+        yield temp_path
+        os.replace(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+@contextmanager
+def atomic_open(filename, mode='w', **kwargs):
+    """open() с атомарной заменой файла (см. atomic_path)"""
+    with atomic_path(filename) as temp_path:
+        with open(temp_path, mode, **kwargs) as f:
+            yield f
+
+
+def write_json_envelope(f, records, key="articles", total=None, **header):
+    """Пишет {"export_date": ..., **header, "total_<key>": N, key: [...]} потоково
+
+    records - любой итерируемый объект (в том числе генератор): в памяти
+    держится только текущая запись. Каждая запись занимает одну строку.
+    Если total не задан и у records нет len(), счетчик пишется после массива.
+    Возвращает число записанных записей.
+    """
+    if total is None and hasattr(records, "__len__"):
+        total = len(records)
+
+    f.write('{\n  "export_date": ')
+    f.write(json.dumps(datetime.now().isoformat()))
+    for name, value in header.items():
+        f.write(f',\n  {json.dumps(name)}: ')
+        f.write(json.dumps(value, ensure_ascii=False))
+    if total is not None:
+        f.write(f',\n  "total_{key}": {total}')
+
+    f.write(f',\n  {json.dumps(key)}: [')
+    count = 0
+    for record in records:
+        f.write(",\n    " if count else "\n    ")
+        f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        count += 1
+    f.write("\n  ]" if count else "]")
+
+    if total is None:
+        f.write(f',\n  "total_{key}": {count}')
+    f.write("\n}\n")
+    return count
+
+
+def write_ndjson(f, records):
+    """Пишет записи в формате NDJSON (одна JSON-запись на строку)"""
+    count = 0
+    for record in records:
+        f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        f.write("\n")
+        count += 1
+    return count
+
+
+def write_articles_json(filename, articles, progress=None):
+    """Сохраняет статьи в JSON-файл экспорта, возвращает число статей"""
+    total = len(articles) if hasattr(articles, "__len__") else None
+    with atomic_open(filename, 'w', encoding='utf-8') as f:
+        return write_json_envelope(f, track_progress(iter_article_records(articles), progress),
+                                   total=total)
+
+
+def write_articles_ndjson(filename, articles, progress=None):
+    """Сохраняет статьи в NDJSON-файл, возвращает число статей"""
+    with atomic_open(filename, 'w', encoding='utf-8') as f:
+        return write_ndjson(f, track_progress(iter_article_records(articles), progress))
+
+
+def write_articles_csv(filename, articles, progress=None):
+    """Сохраняет статьи в CSV, возвращает число статей"""
+    count = 0
+    with atomic_open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=ARTICLE_FIELDS)
+        writer.writeheader()
+
+        for article in track_progress(articles, progress):
+            row = {
+                'id': article["id"],
+                'title': article["title"],
+                'content': article["content"],
+                'source': article["source"],
+                'date': article["date"],
+                'predicted_topic': article["predicted_topic"],
+                'confidence': article["confidence"],
+                'true_topic': article.get("true_topic", ""),
+                'is_corrected': "Да" if article.get("true_topic") else "Нет"
+            }
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def excel_row(article):
+    """Строка листа Excel для статьи (в порядке EXCEL_COLUMNS)"""
+    return [
+        article["id"],
+        article["title"],
+        article["content"],
+        article["source"],
+        article["date"],
+        article["predicted_topic"],
+        article["confidence"] * 100,
+        article.get("true_topic") or "",
+        "Да" if article.get("true_topic") else "Нет"
+    ]
+
+
+def excel_column_widths(articles, sample_size=EXCEL_WIDTH_SAMPLE):
+    """Ширина столбцов по выборке статей (не больше sample_size строк)
+
+    Выборка берется равномерно по всему списку, поэтому длинные тексты
+    в конце тоже учитываются, а время не зависит от размера экспорта.
+    """
+    step = max(1, len(articles) // sample_size)
+    widths = [len(name) for name in EXCEL_COLUMNS]
+    for article in articles[::step][:sample_size]:
+        for i, value in enumerate(excel_row(article)):
+            widths[i] = max(widths[i], len(str(value)))
+    return [min(width + 2, 50) for width in widths]
+
+
+def write_articles_excel(filename, articles, progress=None):
+    """Сохраняет статьи в Excel, возвращает число статей
+
+    Лист пишется в режиме write_only: строки уходят в файл сразу,
+    без DataFrame и второго прохода по ячейкам.
+    """
+    # openpyxl загружается только при экспорте в Excel
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
+    articles = list(articles)
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Статьи')
+
+    # В режиме write_only ширину задают до первой строки
+    for i, width in enumerate(excel_column_widths(articles), 1):
+        worksheet.column_dimensions[get_column_letter(i)].width = width
+
+    worksheet.append(EXCEL_COLUMNS)
+    count = 0
+    try:
+        for article in track_progress(articles, progress):
+            worksheet.append(excel_row(article))
+            count += 1
+    except BaseException:
+        # Закрываем поток строк листа, иначе openpyxl оставит его открытым
+        worksheet.close()
+        raise
+
+    with atomic_path(filename) as temp_path:
+        workbook.save(temp_path)
+    return count
+
+
+def parquet_schema():
+    """Схема Parquet: темы и источники хранятся словарем (повторяются часто)"""
+    import pyarrow as pa
+
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("id", pa.int64()),
+        ("title", pa.string()),
+        ("content", pa.string()),
+        ("source", dictionary),
+        ("date", pa.string()),
+        ("predicted_topic", dictionary),
+        ("confidence", pa.float64()),
+        ("true_topic", dictionary),
+    ])
+
+
+def write_articles_parquet(filename, articles, progress=None, batch_size=PARQUET_BATCH_SIZE):
+    """Сохраняет статьи в Parquet, возвращает число статей
+
+    Статьи пишутся группами по batch_size строк, поэтому в памяти
+    держится только одна группа.
+    """
+    # pyarrow загружается только при экспорте в Parquet
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = parquet_schema().with_metadata({"export_date": datetime.now().isoformat()})
+    count = 0
+
+    def write_batch(writer, batch):
+        columns = {name: [a.get(name) for a in batch] for name in PARQUET_COLUMNS}
+        # Пустая строка в true_topic означает "нет коррекции"
+        columns["true_topic"] = [topic or None for topic in columns["true_topic"]]
+        writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+
+    with atomic_path(filename) as temp_path:
+        with pq.ParquetWriter(temp_path, schema, compression="zstd") as writer:
+            batch = []
+            for article in track_progress(articles, progress):
+                batch.append(article)
+                if len(batch) >= batch_size:
+                    write_batch(writer, batch)
+                    count += len(batch)
+                    batch = []
+            if batch or not count:
+                write_batch(writer, batch)
+                count += len(batch)
+    return count
+
+
+def write_all_data(folder, articles, filters, stats, correction_history, progress=None):
+    """Сохраняет все данные в новую подпапку folder, возвращает ее путь
+
+    Файлы пишутся во временную папку, которая переименовывается только
+    после успешного завершения.
+    """
+    export_folder = os.path.join(folder, f"NewsClassify_Export_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    partial_folder = export_folder + ".partial"
+    os.makedirs(partial_folder, exist_ok=True)
+
+    try:
+        # Экспорт статей: Parquet заметно компактнее, JSON - если нет pyarrow
+        if parquet_export_available():
+            articles_name = "articles.parquet"
+            articles_layout = "Таблица Parquet, по столбцу на каждое поле статьи"
+            write_articles_parquet(os.path.join(partial_folder, articles_name), articles, progress)
+        else:
+            articles_name = "articles.json"
+            articles_layout = "articles: Массив статей"
+            with open(os.path.join(partial_folder, articles_name), 'w', encoding='utf-8') as f:
+                write_json_envelope(f, track_progress(articles, progress), total=len(articles))
+
+        # Экспорт фильтров
+        filters_filename = os.path.join(partial_folder, "filters.json")
+        filters_data = {
+            "export_date": datetime.now().isoformat(),
+            "total_filters": len(filters),
+            "filters": filters
+        }
+        with open(filters_filename, 'w', encoding='utf-8') as f:
+            json.dump(filters_data, f, ensure_ascii=False, indent=2)
+
+        # Экспорт статистики
+        stats_filename = os.path.join(partial_folder, "statistics.json")
+        stats_data = {
+            "export_date": datetime.now().isoformat(),
+            "statistics": stats,
+            "correction_history": correction_history
+        }
+        with open(stats_filename, 'w', encoding='utf-8') as f:
+            json.dump(stats_data, f, ensure_ascii=False, indent=2)
+
+        # Создание README файла
+        readme_filename = os.path.join(partial_folder, "README.txt")
+        readme_content = f"""
+NewsClassify AI - Экспорт данных
+================================
+
+Дата экспорта: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+Содержимое папки:
+1. {articles_name:<16} - Все новостные статьи
+2. filters.json     - Пользовательские фильтры
+3. statistics.json  - Статистика системы и история коррекций
+
+Описание файлов:
+----------------
+1. {articles_name}:
+   - {articles_layout}
+     - id: Уникальный идентификатор
+     - title: Заголовок статьи
+     - content: Текст статьи
+     - source: Источник
+     - date: Дата публикации
+     - predicted_topic: Предсказанная тема
+     - confidence: Уверенность классификации (0-1)
+     - true_topic: Исправленная тема (если есть)
+
+2. filters.json:
+   - filters: Массив фильтров
+     - name: Название фильтра
+     - topic: Тема фильтра
+     - keywords: Ключевые слова
+     - logic: Логика (OR/AND)
+     - active: Активен ли фильтр
+
+3. statistics.json:
+   - statistics: Основная статистика
+     - precision: Точность классификации
+     - corrected_count: Количество коррекций
+     - avg_confidence: Средняя уверенность
+   - correction_history: История исправлений
+
+Для импорта данных обратно в систему используйте меню "Файл → Импорт данных".
+
+© NewsClassify AI v1.0.0
+"""
+
+        with open(readme_filename, 'w', encoding='utf-8') as f:
+            f.write(readme_content)
+
+        os.replace(partial_folder, export_folder)
+    except BaseException:
+        shutil.rmtree(partial_folder, ignore_errors=True)
+        raise
+
+    return export_folder
+
+
+def excel_export_available():
+    """Проверяет наличие openpyxl, не импортируя его"""
+    return importlib.util.find_spec("openpyxl") is not None
+
+
+def parquet_export_available():
+    """Проверяет наличие pyarrow, не импортируя его"""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
 class DataExporter:
-    """Класс для экспорта данных системы"""
+    """Класс для экспорта данных системы
+
+    Статьи записываются в фоновом потоке (см. export_worker) с окном
+    прогресса; файл появляется только после успешного завершения.
+    """
 
     def __init__(self, parent_window=None):
         self.parent = parent_window
 
+    def _run(self, title, write, *args, total=0):
+        """Запускает write(*args, progress=...) в фоне, True при успехе
+
+        Отмена пользователем выбрасывает ExportCancelled; методы экспорта
+        статей возвращают в этом случае None, а не False.
+        """
+        from export_worker import run_export
+        return run_export(self.parent, title, total, write, *args)
+
     def export_articles_json(self, articles):
-        """Экспорт статей в JSON"""
+        """Экспорт статей в JSON (или NDJSON по расширению файла)"""
         try:
             filename, _ = QFileDialog.getSaveFileName(
                 self.parent, "Экспорт статей в JSON",
                 f"news_articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                "JSON Files (*.json)"
+                "JSON Files (*.json);;NDJSON Files (*.ndjson *.jsonl)"
             )
 
             if not filename:
                 return False
 
-            # Подготовка данных
-            export_data = {
-                "export_date": datetime.now().isoformat(),
-                "total_articles": len(articles),
-                "articles": []
-            }
+            # Статьи пишутся по одной, полная копия в памяти не строится
+            if filename.lower().endswith((".ndjson", ".jsonl")):
+                write = write_articles_ndjson
+            else:
+                write = write_articles_json
 
-            for article in articles:
-                article_data = {
-                    "id": article["id"],
-                    "title": article["title"],
-                    "content": article["content"],
-                    "source": article["source"],
-                    "date": article["date"],
-                    "predicted_topic": article["predicted_topic"],
-                    "confidence": article["confidence"],
-                    "true_topic": article.get("true_topic", ""),
-                    "is_corrected": article.get("true_topic") is not None
-                }
-                export_data["articles"].append(article_data)
+            articles = list(articles)
+            return self._run("📄 Экспорт статей в JSON", write, filename, articles,
+                             total=len(articles))
 
-            # Сохранение в файл
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+        except ExportCancelled:
+            return None
+        except Exception as e:
+            print(f"❌ Ошибка экспорта JSON: {e}")
+            return False
 
-            return True
+    def export_articles_ndjson(self, articles):
+        """Экспорт статей в NDJSON (одна статья на строку)"""
+        try:
+            filename, _ = QFileDialog.getSaveFileName(
+                self.parent, "Экспорт статей в NDJSON",
+                f"news_articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson",
+                "NDJSON Files (*.ndjson *.jsonl)"
+            )
+
+            if not filename:
+                return False
+
+            articles = list(articles)
+            return self._run("🧾 Экспорт статей в NDJSON", write_articles_ndjson, filename, articles,
+                             total=len(articles))
 
+        except ExportCancelled:
+            return None
         except Exception as e:
-            print(f"❌ Ошибка экспорта JSON: {e}")
+            print(f"❌ Ошибка экспорта NDJSON: {e}")
             return False
 
     def export_articles_csv(self, articles):
@@ -71,30 +487,12 @@ class DataExporter:
             if not filename:
                 return False
 
-            # Определяем поля
-            fields = ['id', 'title', 'content', 'source', 'date',
-                      'predicted_topic', 'confidence', 'true_topic', 'is_corrected']
-
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fields)
-                writer.writeheader()
-
-                for article in articles:
-                    row = {
-                        'id': article["id"],
-                        'title': article["title"],
-                        'content': article["content"],
-                        'source': article["source"],
-                        'date': article["date"],
-                        'predicted_topic': article["predicted_topic"],
-                        'confidence': article["confidence"],
-                        'true_topic': article.get("true_topic", ""),
-                        'is_corrected': "Да" if article.get("true_topic") else "Нет"
-                    }
-                    writer.writerow(row)
-
-            return True
+            articles = list(articles)
+            return self._run("📊 Экспорт статей в CSV", write_articles_csv, filename, articles,
+                             total=len(articles))
 
+        except ExportCancelled:
+            return None
         except Exception as e:
             print(f"❌ Ошибка экспорта CSV: {e}")
             return False
@@ -111,46 +509,38 @@ class DataExporter:
             if not filename:
                 return False
 
-            # Подготовка данных
-            data = []
-            for article in articles:
-                data.append({
-                    'ID': article["id"],
-                    'Заголовок': article["title"],
-                    'Содержание': article["content"],
-                    'Источник': article["source"],
-                    'Дата': article["date"],
-                    'Предсказанная тема': article["predicted_topic"],
-                    'Уверенность (%)': article["confidence"] * 100,
-                    'Исправленная тема': article.get("true_topic", ""),
-                    'Исправлена': "Да" if article.get("true_topic") else "Нет"
-                })
-
-            # Создание DataFrame и сохранение
-            df = pd.DataFrame(data)
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Статьи', index=False)
-
-                # Автоматическая ширина столбцов
-                worksheet = writer.sheets['Статьи']
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-
-            return True
+            articles = list(articles)
+            return self._run("📈 Экспорт статей в Excel", write_articles_excel, filename, articles,
+                             total=len(articles))
 
+        except ExportCancelled:
+            return None
         except Exception as e:
             print(f"❌ Ошибка экспорта Excel: {e}")
             return False
 
+    def export_articles_parquet(self, articles):
+        """Экспорт статей в Parquet (столбцовый формат)"""
+        try:
+            filename, _ = QFileDialog.getSaveFileName(
+                self.parent, "Экспорт статей в Parquet",
+                f"news_articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet",
+                "Parquet Files (*.parquet)"
+            )
+
+            if not filename:
+                return False
+
+            articles = list(articles)
+            return self._run("🗃️ Экспорт статей в Parquet", write_articles_parquet, filename, articles,
+                             total=len(articles))
+
+        except ExportCancelled:
+            return None
+        except Exception as e:
+            print(f"❌ Ошибка экспорта Parquet: {e}")
+            return False
+
     def export_filters_json(self, filters):
         """Экспорт фильтров в JSON"""
         try:
@@ -169,7 +559,7 @@ class DataExporter:
                 "filters": filters
             }
 
-            with open(filename, 'w', encoding='utf-8') as f:
+            with atomic_open(filename, 'w', encoding='utf-8') as f:
                 json.dump(export_data, f, ensure_ascii=False, indent=2)
 
             return True
@@ -201,7 +591,7 @@ class DataExporter:
                 }
             }
 
-            with open(filename, 'w', encoding='utf-8') as f:
+            with atomic_open(filename, 'w', encoding='utf-8') as f:
                 json.dump(export_data, f, ensure_ascii=False, indent=2)
 
             return True
@@ -219,93 +609,20 @@ class DataExporter:
             )
 
             if not folder:
-                return False
-
-            # Создаем подпапку с временной меткой
-            export_folder = os.path.join(folder, f"NewsClassify_Export_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-            os.makedirs(export_folder, exist_ok=True)
-
-            # Экспорт статей
-            articles_filename = os.path.join(export_folder, "articles.json")
-            articles_data = {
-                "export_date": datetime.now().isoformat(),
-                "total_articles": len(articles),
-                "articles": articles
-            }
-            with open(articles_filename, 'w', encoding='utf-8') as f:
-                json.dump(articles_data, f, ensure_ascii=False, indent=2)
-
-            # Экспорт фильтров
-            filters_filename = os.path.join(export_folder, "filters.json")
-            filters_data = {
-                "export_date": datetime.now().isoformat(),
-                "total_filters": len(filters),
-                "filters": filters
-            }
-            with open(filters_filename, 'w', encoding='utf-8') as f:
-                json.dump(filters_data, f, ensure_ascii=False, indent=2)
-
-            # Экспорт статистики
-            stats_filename = os.path.join(export_folder, "statistics.json")
-            stats_data = {
-                "export_date": datetime.now().isoformat(),
-                "statistics": stats,
-                "correction_history": correction_history
-            }
-            with open(stats_filename, 'w', encoding='utf-8') as f:
-                json.dump(stats_data, f, ensure_ascii=False, indent=2)
-
-            # Создание README файла
-            readme_filename = os.path.join(export_folder, "README.txt")
-            readme_content = f"""
-NewsClassify AI - Экспорт данных
-================================
-
-Дата экспорта: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                return False, ""
 
-Содержимое папки:
-1. articles.json    - Все новостные статьи
-2. filters.json     - Пользовательские фильтры
-3. statistics.json  - Статистика системы и история коррекций
-
-Описание файлов:
-----------------
-1. articles.json:
-   - articles: Массив статей
-     - id: Уникальный идентификатор
-     - title: Заголовок статьи
-     - content: Текст статьи
-     - source: Источник
-     - date: Дата публикации
-     - predicted_topic: Предсказанная тема
-     - confidence: Уверенность классификации (0-1)
-     - true_topic: Исправленная тема (если есть)
-
-2. filters.json:
-   - filters: Массив фильтров
-     - name: Название фильтра
-     - topic: Тема фильтра
-     - keywords: Ключевые слова
-     - logic: Логика (OR/AND)
-     - active: Активен ли фильтр
-
-3. statistics.json:
-   - statistics: Основная статистика
-     - precision: Точность классификации
-     - corrected_count: Количество коррекций
-     - avg_confidence: Средняя уверенность
-   - correction_history: История исправлений
-
-Для импорта данных обратно в систему используйте меню "Файл → Импорт данных".
-
-© NewsClassify AI v1.0.0
-"""
+            articles = list(articles)
+            result = {}
 
-            with open(readme_filename, 'w', encoding='utf-8') as f:
-                f.write(readme_content)
+            def write(progress=None):
+                result["folder"] = write_all_data(folder, articles, list(filters), dict(stats),
+                                                  list(correction_history), progress)
 
-            return True, export_folder
+            self._run("💾 Экспорт всех данных", write, total=len(articles))
+            return True, result["folder"]
 
+        except ExportCancelled:
+            return None, ""
         except Exception as e:
             print(f"❌ Ошибка полного экспорта: {e}")
             return False, ""
\ No newline at end of file
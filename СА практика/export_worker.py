@@ -0,0 +1,128 @@
+"""
+Фоновый экспорт данных для NewsClassify AI
+
+Функция записи (write_articles_json и др. из export_data) выполняется
+в QThreadPool, а окно прогресса показывает скорость, оставшееся время
+и позволяет отменить экспорт. Файл пишется во временный и заменяет
+целевой только после успешного завершения.
+"""
+
+import time
+
+from PyQt6.QtCore import QEventLoop, QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtWidgets import QProgressDialog
+
+from app_logging import get_logger
+from export_data import ExportCancelled
+
+
+logger = get_logger("export")
+
+
+class _ExportSignals(QObject):
+    """Сигналы задачи экспорта (QRunnable не может иметь своих сигналов)"""
+    progress = pyqtSignal(int)
+    finished = pyqtSignal()
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class ExportTask(QRunnable):
+    """Выполняет write(*args, progress=...) в потоке пула"""
+
+    def __init__(self, write, args):
+        super().__init__()
+        self.write = write
+        self.args = args
+        self.cancel_requested = False
+        self.signals = _ExportSignals()
+
+    def run(self):
+        try:
+            self.write(*self.args, progress=self._on_progress)
+        except ExportCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit()
+
+    def _on_progress(self, done):
+        self.signals.progress.emit(done)
+        return not self.cancel_requested
+
+
+def format_eta(seconds):
+    """Оставшееся время в виде 'N с' или 'M мин N с'"""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds} с"
+    return f"{seconds // 60} мин {seconds % 60} с"
+
+
+def progress_text(done, total, elapsed):
+    """Подпись окна прогресса: статьи, скорость и оставшееся время"""
+    text = f"Записано статей: {done} из {total}"
+    if done and elapsed > 0:
+        rate = done / elapsed
+        text += f"\n⚡ {rate:,.0f} статей/с".replace(",", " ")
+        if total > done:
+            text += f", осталось ≈ {format_eta((total - done) / rate)}"
+    return text
+
+
+def run_export(parent, title, total, write, *args, pool=None):
+    """Выполняет экспорт в фоне, показывая окно прогресса
+
+    Пока идет запись, обрабатываются события Qt, поэтому окно приложения
+    не зависает. Возвращает True при успехе; при отмене выбрасывается
+    ExportCancelled, ошибка записи - RuntimeError.
+    """
+    pool = pool or QThreadPool.globalInstance()
+    task = ExportTask(write, args)
+    loop = QEventLoop()
+    outcome = {}
+
+    dialog = QProgressDialog(title, "Отмена", 0, max(total, 1), parent)
+    dialog.setWindowTitle("Экспорт данных")
+    dialog.setWindowModality(Qt.WindowModality.WindowModal)
+    dialog.setMinimumDuration(300)
+    dialog.setAutoReset(False)
+    dialog.setAutoClose(False)
+    dialog.setLabelText(f"{title}\n{progress_text(0, total, 0)}")
+
+    started = time.monotonic()
+
+    def on_progress(done):
+        dialog.setValue(min(done, dialog.maximum()))
+        dialog.setLabelText(f"{title}\n{progress_text(done, total, time.monotonic() - started)}")
+
+    def on_cancel():
+        task.cancel_requested = True
+        dialog.setLabelText(f"{title}\n⏹️ Отмена...")
+
+    def on_done(result, message=""):
+        outcome["result"] = result
+        outcome["message"] = message
+        loop.quit()
+
+    task.signals.progress.connect(on_progress)
+    task.signals.finished.connect(lambda: on_done("finished"))
+    task.signals.cancelled.connect(lambda: on_done("cancelled"))
+    task.signals.failed.connect(lambda message: on_done("failed", message))
+    dialog.canceled.connect(on_cancel)
+
+    # Сигналы из потока пула приходят в очередь событий, loop их дождется
+    pool.start(task)
+    loop.exec()
+    dialog.close()
+
+    elapsed = time.monotonic() - started
+    if outcome["result"] == "failed":
+        raise RuntimeError(outcome["message"])
+    if outcome["result"] == "cancelled":
+        logger.info("⏹️ Экспорт отменен: %s", title)
+        raise ExportCancelled()
+
+    logger.info("💾 %s: %d статей за %.1f с", title, total, elapsed)
+    return True
\ No newline at end of file
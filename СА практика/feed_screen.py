@@ -1,24 +1,30 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QPushButton, QComboBox,
-                             QScrollArea, QFrame, QSizePolicy,
+                             QListView, QFrame, QSizePolicy,
                              QMessageBox, QDialog, QVBoxLayout as QVBoxLayout2,
-                             QInputDialog)
-from PyQt6.QtCore import Qt
+                             QInputDialog, QAbstractItemView)
+from PyQt6.QtCore import Qt, QPersistentModelIndex
 from PyQt6.QtGui import QFont
 
-from mock_data_news import mock_data
-from article_card import ArticleCard
-from export_data import DataExporter
+from app_logging import get_logger
+from mock_data_news import get_mock_data, ArticleCursor
+from article_model import ArticleListModel, ArticleDelegate
+
+
+logger = get_logger("feed")
 
 
 class FeedScreen(QWidget):
     def __init__(self):
         super().__init__()
         self.current_filter = "Все темы"
+        # Тема текущей ленты для новых статей (False - лента по ключевым словам)
+        self.live_topic = None
         self.init_ui()
         self.load_articles()
 
     def init_ui(self):
+        mock_data = get_mock_data()
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -121,31 +127,51 @@ class FeedScreen(QWidget):
 
         layout.addWidget(filter_panel)
 
-        # Область прокрутки для статей
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
+        # Список статей: рисуются только видимые строки
+        self.article_model = ArticleListModel(self)
+        self.article_delegate = ArticleDelegate(self)
+        self.article_delegate.article_corrected.connect(self.on_article_corrected)
+
+        self.article_view = QListView()
+        self.article_view.setModel(self.article_model)
+        self.article_view.setItemDelegate(self.article_delegate)
+        self.article_view.setUniformItemSizes(True)
+        self.article_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.article_view.verticalScrollBar().setSingleStep(20)
+        self.article_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.article_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.article_view.setMouseTracking(True)
+        self.article_view.entered.connect(self.on_article_hovered)
+        self.article_view.setStyleSheet("""
+            QListView {
                 border: none;
                 background-color: transparent;
             }
         """)
-
-        # Контейнер для статей
-        self.scroll_widget = QWidget()
-        self.articles_layout = QVBoxLayout(self.scroll_widget)
-        self.articles_layout.setSpacing(10)
-        self.articles_layout.addStretch()
-
-        self.scroll_area.setWidget(self.scroll_widget)
-        layout.addWidget(self.scroll_area, 1)
+        layout.addWidget(self.article_view, 1)
+
+        # Карточка-редактор открыта только для строки под курсором
+        self.editor_index = None
+
+        # Сообщение, если статей нет
+        self.no_articles = QLabel()
+        self.no_articles.setStyleSheet("""
+            font-size: 14pt;
+            color: #95a5a6;
+            padding: 50px;
+            text-align: center;
+        """)
+        self.no_articles.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_articles.hide()
+        layout.addWidget(self.no_articles, 1)
 
         # Инициализируем список фильтров
         self.update_filter_list()
 
     def update_filter_list(self):
         """Обновляет список фильтров в выпадающем меню"""
-        print("🔄 Обновление списка фильтров в ленте...")
+        mock_data = get_mock_data()
+        logger.debug("🔄 Обновление списка фильтров в ленте...")
 
         # Сохраняем текущий выбор
         current_text = self.filter_combo.currentText()
@@ -189,7 +215,7 @@ class FeedScreen(QWidget):
 
                     self.filter_combo.addItem(display_text)
                     active_filters_added = True
-                    print(f"   ✅ Добавлен фильтр: {filter_name}")
+                    logger.debug("   ✅ Добавлен фильтр: %s", filter_name)
 
             if not active_filters_added:
                 self.filter_combo.addItem("   😔 Нет активных фильтров")
@@ -198,21 +224,22 @@ class FeedScreen(QWidget):
         for i in range(self.filter_combo.count()):
             if self.filter_combo.itemText(i) == current_text:
                 self.filter_combo.setCurrentIndex(i)
-                print(f"✅ Восстановлен выбор: {current_text}")
+                logger.debug("✅ Восстановлен выбор: %s", current_text)
                 break
         else:
             # Если предыдущий выбор не найден, выбираем "Все темы"
             self.filter_combo.setCurrentIndex(0)
-            print("✅ Установлен выбор: Все темы")
+            logger.debug("✅ Установлен выбор: Все темы")
 
-        print(f"✅ Список фильтров обновлен. Всего элементов: {self.filter_combo.count()}")
+        logger.debug("✅ Список фильтров обновлен. Всего элементов: %d", self.filter_combo.count())
 
         # Обновляем счетчик статей
         self.update_article_count()
 
     def on_filter_changed(self, selected_text):
         """Обрабатывает изменение фильтра"""
-        print(f"🎯 Выбран фильтр: {selected_text}")
+        mock_data = get_mock_data()
+        logger.info("🎯 Выбран фильтр: %s", selected_text)
 
         # Проверяем, выбран ли пользовательский фильтр
         if selected_text.startswith("   ⚙️"):
@@ -223,8 +250,8 @@ class FeedScreen(QWidget):
                 filter_name = filter_text.split(" (")[0]
                 filter_topic = filter_text.split(" (")[1].split(")")[0]
 
-                print(f"   Применяем пользовательский фильтр: {filter_name}")
-                print(f"   Тема фильтра: {filter_topic}")
+                logger.debug("   Применяем пользовательский фильтр: %s", filter_name)
+                logger.debug("   Тема фильтра: %s", filter_topic)
 
                 # Находим фильтр в списке
                 for user_filter in mock_data.user_filters:
@@ -243,8 +270,8 @@ class FeedScreen(QWidget):
                                 logic=logic,
                                 topic=topic
                             )
-                            print(f"   Найдено {len(articles)} статей по ключевым словам: {keywords}")
-                            print(f"   Логика фильтрации: {logic}")
+                            logger.debug("   Найдено %d статей по ключевым словам: %s", len(articles), keywords)
+                            logger.debug("   Логика фильтрации: %s", logic)
                             self.load_filtered_articles(articles, filter_name)
                         else:
                             # Если нет ключевых слов, фильтруем просто по теме
@@ -256,17 +283,17 @@ class FeedScreen(QWidget):
                 self.load_articles()
 
         elif selected_text == "Все темы":
-            print("   Применен фильтр: Все темы")
+            logger.debug("   Применен фильтр: Все темы")
             self.load_articles()
 
         elif selected_text in mock_data.available_topics:
-            print(f"   Применен фильтр по теме: {selected_text}")
+            logger.debug("   Применен фильтр по теме: %s", selected_text)
             self.load_articles(selected_text)
 
         else:
             # Игнорируем разделители и заголовки
             if selected_text != "─" * 20 and selected_text != "📂 Мои фильтры:":
-                print(f"   Неизвестный фильтр, загружаем все темы")
+                logger.debug("   Неизвестный фильтр, загружаем все темы")
                 self.load_articles()
 
         # Обновляем текущий фильтр
@@ -274,38 +301,13 @@ class FeedScreen(QWidget):
 
     def load_articles(self, filter_topic=None):
         """Загружает статьи с учетом фильтра"""
-        print(f"📰 Загрузка статей. Фильтр: {filter_topic or 'Все темы'}")
-
-        # Очищаем старые статьи
-        for i in reversed(range(self.articles_layout.count())):
-            item = self.articles_layout.itemAt(i)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Получаем отфильтрованные статьи
-        articles = mock_data.get_articles_by_filter(filter_topic)
-
-        # Добавляем новые статьи
-        if articles:
-            for article in articles:
-                card = ArticleCard(article)
-                # Подключаем сигнал об исправлении
-                card.article_corrected.connect(self.on_article_corrected)
-                self.articles_layout.insertWidget(0, card)
-
-            print(f"✅ Загружено {len(articles)} статей")
-        else:
-            # Сообщение, если статей нет
-            no_articles = QLabel("😔 Статей по выбранному фильтру не найдено")
-            no_articles.setStyleSheet("""
-                font-size: 14pt;
-                color: #95a5a6;
-                padding: 50px;
-                text-align: center;
-            """)
-            no_articles.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.articles_layout.addWidget(no_articles)
-            print("❌ Статей не найдено")
+        mock_data = get_mock_data()
+        logger.debug("📰 Загрузка статей. Фильтр: %s", filter_topic or 'Все темы')
+
+        # Статьи подгружаются страницами по мере прокрутки
+        self.live_topic = filter_topic
+        cursor = mock_data.open_cursor(filter_topic)
+        self.show_articles(cursor, "😔 Статей по выбранному фильтру не найдено")
 
         # Обновляем счетчик статей
         self.update_article_count(filter_topic)
@@ -313,60 +315,81 @@ class FeedScreen(QWidget):
     def load_filtered_articles(self, articles, filter_name=None):
         """Загружает предварительно отфильтрованные статьи"""
         filter_info = f"фильтром '{filter_name}'" if filter_name else "ключевыми словами"
-        print(f"📰 Загрузка статей, отфильтрованных {filter_info}")
-
-        # Очищаем старые статьи
-        for i in reversed(range(self.articles_layout.count())):
-            item = self.articles_layout.itemAt(i)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Добавляем новые статьи
-        if articles:
-            for article in articles:
-                card = ArticleCard(article)
-                card.article_corrected.connect(self.on_article_corrected)
-                self.articles_layout.insertWidget(0, card)
-
-            print(f"✅ Загружено {len(articles)} статей")
+        logger.debug("📰 Загрузка статей, отфильтрованных %s", filter_info)
+
+        if filter_name:
+            message = f"😔 Статей по фильтру '{filter_name}' не найдено"
         else:
-            # Сообщение, если статей нет
-            if filter_name:
-                message = f"😔 Статей по фильтру '{filter_name}' не найдено"
-            else:
-                message = "😔 Статей по выбранным ключевым словам не найдено"
-
-            no_articles = QLabel(message)
-            no_articles.setStyleSheet("""
-                font-size: 14pt;
-                color: #95a5a6;
-                padding: 50px;
-                text-align: center;
-            """)
-            no_articles.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.articles_layout.addWidget(no_articles)
-            print("❌ Статей не найдено")
+            message = "😔 Статей по выбранным ключевым словам не найдено"
+        self.live_topic = False
+        self.show_articles(ArticleCursor(articles), message)
 
         # Обновляем счетчик статей
         self.update_article_count_special(len(articles), filter_name)
 
+    def show_articles(self, cursor, empty_message):
+        """Передает курсор по статьям в модель ленты"""
+        self.close_article_editor()
+        self.article_model.set_cursor(cursor)
+        self.article_view.scrollToTop()
+
+        if cursor.total:
+            self.no_articles.hide()
+            self.article_view.show()
+            logger.debug("✅ Найдено %d статей, показано %d", cursor.total, cursor.fetched)
+        else:
+            self.article_view.hide()
+            self.no_articles.setText(empty_message)
+            self.no_articles.show()
+            logger.debug("❌ Статей не найдено")
+
+    def on_articles_added(self, articles):
+        """Показывает статьи, добавленные фоновой классификацией"""
+        if self.live_topic is False:
+            return
+
+        if self.live_topic:
+            articles = [a for a in articles if a["predicted_topic"] == self.live_topic]
+        if not articles:
+            return
+
+        self.article_model.prepend_articles(articles)
+        if self.no_articles.isVisible():
+            self.no_articles.hide()
+            self.article_view.show()
+        self.update_article_count(self.live_topic)
+
+    def on_article_hovered(self, index):
+        """Открывает карточку с панелью коррекции для строки под курсором"""
+        if self.editor_index is not None and self.editor_index == index:
+            return
+
+        self.close_article_editor()
+        self.editor_index = QPersistentModelIndex(index)
+        self.article_view.openPersistentEditor(index)
+
+    def close_article_editor(self):
+        """Закрывает открытую карточку-редактор"""
+        if self.editor_index is not None:
+            if self.editor_index.isValid():
+                index = self.article_model.index(self.editor_index.row())
+                self.article_view.closePersistentEditor(index)
+            self.editor_index = None
+
     def on_article_corrected(self, article_id):
         """Обрабатывает исправление статьи"""
-        print(f"🔄 Статья {article_id} исправлена, обновляю интерфейс...")
+        logger.debug("🔄 Статья %s исправлена, обновляю интерфейс...", article_id)
 
-        # Можно добавить дополнительные действия:
-        # 1. Обновить статистику
-        # 2. Обновить фильтры
-        # 3. Показать уведомление
+        # Перерисовываем строку с новой темой
+        self.article_model.refresh_article(article_id)
 
-        # Просто выводим сообщение
-        print(f"✅ Интерфейс обновлен для статьи {article_id}")
+        logger.debug("✅ Интерфейс обновлен для статьи %s", article_id)
 
     def update_article_count(self, filter_topic=None):
         """Обновляет счетчик статей"""
+        mock_data = get_mock_data()
         try:
-            articles = mock_data.get_articles_by_filter(filter_topic)
-            count = len(articles)
+            count = mock_data.count_articles_by_filter(filter_topic)
 
             # Формируем текст счетчика
             if filter_topic:
@@ -377,25 +400,26 @@ class FeedScreen(QWidget):
             # Проверяем, что article_count существует
             if hasattr(self, 'article_count') and self.article_count:
                 self.article_count.setText(count_text)
-                print(f"📊 {count_text}")
+                logger.debug("📊 %s", count_text)
             else:
-                print(f"⚠️ article_count не доступен. Статей: {count}")
+                logger.warning("⚠️ article_count не доступен. Статей: %d", count)
 
         except Exception as e:
-            print(f"❌ Ошибка обновления счетчика статей: {e}")
+            logger.error("❌ Ошибка обновления счетчика статей: %s", e)
 
     def update_article_count_special(self, count, filter_name=None):
         """Обновляет счетчик для фильтрованных статей"""
         if hasattr(self, 'article_count') and self.article_count:
             if filter_name:
                 self.article_count.setText(f"Найдено статей по фильтру '{filter_name}': {count}")
-                print(f"📊 Найдено статей по фильтру '{filter_name}': {count}")
+                logger.debug("📊 Найдено статей по фильтру '%s': %d", filter_name, count)
             else:
                 self.article_count.setText(f"Найдено статей: {count}")
-                print(f"📊 Найдено статей: {count}")
+                logger.debug("📊 Найдено статей: %d", count)
 
     def export_filtered_articles(self):
         """Экспорт отфильтрованных статей"""
+        mock_data = get_mock_data()
         try:
             # Получаем текущие статьи
             current_text = self.filter_combo.currentText()
@@ -435,8 +459,14 @@ class FeedScreen(QWidget):
                                     "Нет статей для экспорта")
                 return
 
+            from export_data import DataExporter, excel_export_available, parquet_export_available
+
             # Простой диалог выбора формата
-            formats = ["JSON (*.json)", "CSV (*.csv)", "Excel (*.xlsx)"]
+            formats = ["JSON (*.json)", "NDJSON (*.ndjson)", "CSV (*.csv)"]
+            if excel_export_available():
+                formats.append("Excel (*.xlsx)")
+            if parquet_export_available():
+                formats.append("Parquet (*.parquet)")
             format_choice, ok = QInputDialog.getItem(
                 self, "💾 Экспорт статей",
                 f"Выберите формат для экспорта {len(articles)} статей:",
@@ -450,23 +480,30 @@ class FeedScreen(QWidget):
             exporter = DataExporter(self)
             success = False
 
-            if "JSON" in format_choice:
+            if "NDJSON" in format_choice:
+                success = exporter.export_articles_ndjson(articles)
+            elif "JSON" in format_choice:
                 success = exporter.export_articles_json(articles)
             elif "CSV" in format_choice:
                 success = exporter.export_articles_csv(articles)
             elif "Excel" in format_choice:
                 success = exporter.export_articles_excel(articles)
+            elif "Parquet" in format_choice:
+                success = exporter.export_articles_parquet(articles)
 
             if success:
                 QMessageBox.information(self, "✅ Успех",
                                         f"Экспортировано {len(articles)} статей")
+            elif success is None:
+                QMessageBox.information(self, "⏹️ Экспорт отменен",
+                                        "Экспорт отменен, файл не создан")
             else:
                 QMessageBox.warning(self, "❌ Ошибка", "Не удалось экспортировать статьи")
 
         except ImportError as e:
             print(f"❌ Ошибка импорта модуля: {e}")
             QMessageBox.warning(self, "⚠️ Предупреждение",
-                                "Модуль экспорта не найден. Установите pandas и openpyxl.")
+                                "Модуль экспорта не найден. Установите openpyxl.")
         except Exception as e:
             print(f"❌ Ошибка экспорта: {e}")
             QMessageBox.critical(self, "❌ Ошибка",
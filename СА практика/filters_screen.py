@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
                              QListWidget, QListWidgetItem, QMessageBox,
                              QRadioButton, QButtonGroup, QGroupBox)
 from PyQt6.QtCore import Qt
-from mock_data_news import mock_data
+from mock_data_news import get_mock_data
 
 
 class FiltersScreen(QWidget):
@@ -257,6 +257,7 @@ class FiltersScreen(QWidget):
 
     def create_filter(self):
         """Создает новый фильтр"""
+        mock_data = get_mock_data()
         print("=" * 50)
         print("🔄 СОЗДАНИЕ НОВОГО ФИЛЬТРА")
 
@@ -313,6 +314,7 @@ class FiltersScreen(QWidget):
 
     def load_filters(self):
         """Загружает список фильтров"""
+        mock_data = get_mock_data()
         print(f"📂 Загружаю {len(mock_data.user_filters)} фильтров")
 
         self.filters_list.clear()
@@ -391,6 +393,7 @@ class FiltersScreen(QWidget):
 
     def delete_filter(self):
         """Удаляет фильтр"""
+        mock_data = get_mock_data()
         current = self.filters_list.currentItem()
         if not current:
             return
@@ -2,12 +2,358 @@
 Модуль для импорта данных в систему
 """
 
+import codecs
 import json
+import os
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QFileDialog, QMessageBox, QTextEdit)
 from PyQt6.QtCore import Qt
 
 
+# Размер порции чтения файла и пачки статей при разборе
+READ_CHUNK_SIZE = 64 * 1024
+IMPORT_BATCH_SIZE = 1000
+
+
+class ImportCancelled(Exception):
+    """Импорт остановлен пользователем"""
+
+
+class JsonRecordReader:
+    """Потоковое чтение записей из файла экспорта
+
+    Поддерживает оба формата экспорта:
+      - JSON-конверт {"export_date": ..., "<key>": [...]} - записи читаются
+        из массива key, остальные поля верхнего уровня попадают в header;
+      - NDJSON - по одной JSON-записи на строку.
+
+    Файл читается порциями по chunk_size байт и разбирается через
+    JSONDecoder.raw_decode, поэтому в памяти держится одна порция и
+    текущая запись. Формат определяется по первому объекту: если в нем
+    нет массива key, файл считается NDJSON, а объект - первой записью.
+    """
+
+    def __init__(self, f, key="articles", chunk_size=READ_CHUNK_SIZE):
+        self._f = f
+        self.key = key
+        self.chunk_size = chunk_size
+        self.header = {}
+        self.format = None
+        self.bytes_read = 0
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        """Дочитывает порцию файла, возвращает False в конце файла"""
+        if self._eof:
+            return False
+
+        chunk = self._f.read(self.chunk_size)
+        self.bytes_read += len(chunk)
+        self._eof = not chunk
+
+        # Прочитанная часть буфера больше не нужна
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        self._buf += self._text_decoder.decode(chunk, final=self._eof)
+        return not self._eof
+
+    def _peek(self):
+        """Следующий значимый символ (пробелы пропускаются), '' в конце файла"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars):
+        ch = self._peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"Ожидался символ {chars!r}, получено {ch or 'конец файла'!r}")
+        self._pos += 1
+        return ch
+
+    def _value(self):
+        """Разбирает одно JSON-значение, дочитывая файл при необходимости"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # Число на границе порции могло оборваться
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def __iter__(self):
+        if self._expect("{[") == "[":
+            # Просто массив записей
+            self.format = "json"
+            yield from self._array()
+            return
+
+        # Поля первого объекта по одному: записи key не грузятся целиком
+        first = {}
+        if self._peek() == "}":
+            self._pos += 1
+        else:
+            while True:
+                name = self._value()
+                self._expect(":")
+                if name == self.key and self._peek() == "[":
+                    self._pos += 1
+                    self.format = "json"
+                    self.header.update(first)
+                    yield from self._array()
+                    self._rest_of_header()
+                    return
+                first[name] = self._value()
+                if self._expect(",}") == "}":
+                    break
+
+        # Массива key нет: это NDJSON, первый объект - уже запись
+        self.format = "ndjson"
+        yield first
+        while self._peek():
+            yield self._value()
+
+    def _array(self):
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(",]") == "]":
+                return
+
+    def _rest_of_header(self):
+        """Поля конверта после массива (например, total_articles)"""
+        while self._expect(",}") == ",":
+            name = self._value()
+            self._expect(":")
+            self.header[name] = self._value()
+
+
+class ParquetRecordReader:
+    """Чтение статей из файла Parquet группами строк
+
+    columns ограничивает набор читаемых столбцов: остальные столбцы
+    с диска не читаются. bytes_read оценивается по доле прочитанных строк.
+    """
+
+    def __init__(self, f, columns=None, batch_size=IMPORT_BATCH_SIZE):
+        # pyarrow загружается только при работе с Parquet
+        import pyarrow.parquet as pq
+
+        self._file = pq.ParquetFile(f)
+        self.columns = columns
+        self.batch_size = batch_size
+        self.format = "parquet"
+        self.bytes_read = 0
+        self._total_bytes = os.fstat(f.fileno()).st_size
+
+        metadata = self._file.metadata
+        self.header = {"total_articles": metadata.num_rows}
+        export_date = (self._file.schema_arrow.metadata or {}).get(b"export_date")
+        if export_date:
+            self.header["export_date"] = export_date.decode("utf-8")
+
+    def __iter__(self):
+        total_rows = self.header["total_articles"]
+        rows = 0
+        for batch in self._file.iter_batches(batch_size=self.batch_size, columns=self.columns):
+            rows += batch.num_rows
+            self.bytes_read = self._total_bytes * rows // max(total_rows, 1)
+            yield from batch.to_pylist()
+
+
+def is_parquet_file(filename):
+    return filename.lower().endswith(".parquet")
+
+
+def open_record_reader(f, filename, key="articles"):
+    """Читатель записей по типу файла (Parquet, JSON или NDJSON)"""
+    if is_parquet_file(filename):
+        return ParquetRecordReader(f)
+    return JsonRecordReader(f, key)
+
+
+def read_article_columns(filename, columns):
+    """Только нужные столбцы статей из Parquet: {столбец: [значения]}
+
+    Для аналитики по экспорту: текст статей при этом не читается.
+    """
+    import pyarrow.parquet as pq
+
+    return pq.read_table(filename, columns=list(columns)).to_pydict()
+
+
+def read_preview(filename, limit=3, key="articles"):
+    """Первые записи файла и его заголовок без чтения остального файла
+
+    Возвращает (header, records, format).
+    """
+    with open(filename, 'rb') as f:
+        reader = open_record_reader(f, filename, key)
+        records = []
+        for record in reader:
+            records.append(record)
+            if len(records) >= limit:
+                break
+        return reader.header, records, reader.format
+
+
+def article_from_record(record):
+    """Статья MockNewsData из записи файла экспорта"""
+    article = {
+        "id": record.get("id"),
+        "title": record.get("title", ""),
+        "content": record.get("content", ""),
+        "source": record.get("source", ""),
+        "date": record.get("date", ""),
+        "predicted_topic": record.get("predicted_topic"),
+        "confidence": record.get("confidence"),
+        # В экспорте отсутствие коррекции записано пустой строкой
+        "true_topic": record.get("true_topic") or None,
+    }
+    return article
+
+
+def read_import_batches(filename, classifier, batch_size=IMPORT_BATCH_SIZE):
+    """Читает статьи из файла экспорта пачками
+
+    Статьи без темы классифицируются моделью classifier. Выдает кортежи
+    (пачка статей, байт прочитано, размер файла). Данные приложения не
+    трогает, поэтому может выполняться в рабочем потоке.
+    """
+    total_bytes = os.path.getsize(filename)
+    with open(filename, 'rb') as f:
+        reader = open_record_reader(f, filename)
+        batch = []
+        for record in reader:
+            batch.append(article_from_record(record))
+            if len(batch) >= batch_size:
+                _classify_import_batch(classifier, batch)
+                yield batch, reader.bytes_read, total_bytes
+                batch = []
+        if batch:
+            _classify_import_batch(classifier, batch)
+            yield batch, reader.bytes_read, total_bytes
+
+
+def _classify_import_batch(classifier, batch):
+    """Классифицирует статьи пачки, у которых нет темы"""
+    unclassified = [a for a in batch if not a["predicted_topic"] or a["confidence"] is None]
+    if unclassified:
+        pairs = [(a["title"], a["content"]) for a in unclassified]
+        topics, confidences = classifier.predict_topics(pairs)
+        for article, topic, confidence in zip(unclassified, topics.tolist(), confidences.tolist()):
+            article["predicted_topic"] = topic
+            article["confidence"] = confidence
+
+
+class ArticleImport:
+    """Добавляет пачки импорта в MockNewsData с откатом
+
+    Пачки попадают в данные сразу, по мере чтения файла. replace=True
+    перед первой пачкой убирает текущие статьи, иначе статьи добавляются
+    (конфликтующие id заменяются новыми). rollback() возвращает данные
+    к состоянию до импорта.
+    """
+
+    def __init__(self, news_data, replace=True):
+        self.news_data = news_data
+        self.replace = replace
+        self.count = 0
+        self._used_ids = set()
+        self._added_ids = []
+        self._previous = None
+
+    def add(self, batch):
+        """Назначает пачке id и добавляет ее в данные"""
+        if self.replace and self._previous is None:
+            self._previous = self.news_data.articles
+            self.news_data.replace_articles([])
+
+        _prepare_import_batch(self.news_data, batch, self._used_ids,
+                              check_existing=not self.replace)
+        self._added_ids.extend(article["id"] for article in batch)
+        self.news_data.add_articles(batch)
+        self.count += len(batch)
+
+    def rollback(self):
+        """Убирает добавленные статьи и возвращает прежние"""
+        if self._previous is not None:
+            self.news_data.replace_articles(self._previous)
+        elif self._added_ids:
+            self.news_data.delete_articles(self._added_ids)
+        self._previous = None
+        self._added_ids = []
+        self.count = 0
+
+
+def import_articles(filename, news_data, replace=True, batch_size=IMPORT_BATCH_SIZE,
+                    progress=None):
+    """Загружает статьи из файла экспорта в MockNewsData
+
+    Статьи добавляются пачками по мере чтения файла (см. ArticleImport).
+    При ошибке разбора или отмене импорт откатывается и остаются прежние
+    статьи.
+
+    Статьи без темы классифицируются текущей моделью.
+    progress(статей, байт прочитано, размер файла) вызывается после каждой
+    пачки; если он вернет False, выбрасывается ImportCancelled. Возвращает
+    число загруженных статей.
+    """
+    articles_import = ArticleImport(news_data, replace)
+    try:
+        for batch, bytes_read, total_bytes in read_import_batches(
+                filename, news_data.ml_classifier, batch_size):
+            articles_import.add(batch)
+            if progress is not None and progress(articles_import.count, bytes_read, total_bytes) is False:
+                raise ImportCancelled()
+    except Exception:
+        articles_import.rollback()
+        raise
+    return articles_import.count
+
+
+def _prepare_import_batch(news_data, batch, used_ids, check_existing):
+    """Назначает id статьям пачки
+
+    used_ids - id уже подготовленных статей импорта; check_existing -
+    проверять также id статей, которые уже есть в данных.
+    """
+    # Статьи без id или с уже занятым id получают новый
+    pending = []
+    for article in batch:
+        article_id = article["id"]
+        if (article_id is None or article_id in used_ids
+                or (check_existing and news_data.get_article(article_id) is not None)):
+            pending.append(article)
+        else:
+            used_ids.add(article_id)
+
+    if pending:
+        next_id = max(used_ids, default=0) + 1
+        if check_existing:
+            next_id = max(next_id, news_data.next_article_id())
+        for article in pending:
+            article["id"] = next_id
+            used_ids.add(next_id)
+            next_id += 1
+
+
 class DataImporter(QDialog):
     """Диалог импорта данных"""
 
@@ -35,7 +381,7 @@ class DataImporter(QDialog):
         # Описание
         description = QLabel(
             "Выберите файл для импорта данных. Поддерживаются форматы:\n"
-            "• JSON файлы экспорта NewsClassify AI\n"
+            "• JSON, NDJSON и Parquet файлы экспорта NewsClassify AI\n"
             "• CSV файлы со статьями\n\n"
             "⚠️ Внимание: Импорт перезапишет текущие данные!"
         )
@@ -53,7 +399,7 @@ class DataImporter(QDialog):
         btn_layout.setSpacing(10)
 
         # Импорт статей из JSON
-        btn_articles_json = QPushButton("📰 Импорт статей (JSON)")
+        btn_articles_json = QPushButton("📰 Импорт статей (JSON, Parquet)")
         btn_articles_json.setStyleSheet("""
             QPushButton {
                 background-color: #3498db;
@@ -150,49 +496,71 @@ class DataImporter(QDialog):
         layout.addWidget(btn_close, 0, Qt.AlignmentFlag.AlignRight)
 
     def import_articles_json(self):
-        """Импорт статей из JSON файла"""
+        """Импорт статей из JSON или NDJSON файла"""
         try:
             filename, _ = QFileDialog.getOpenFileName(
-                self, "Выберите JSON файл со статьями",
-                "", "JSON Files (*.json)"
+                self, "Выберите файл со статьями",
+                "", "Файлы экспорта (*.json *.ndjson *.jsonl *.parquet)"
             )
 
             if not filename:
                 return
 
-            # Загрузка данных
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Для предпросмотра читается только начало файла
+            header, first_records, file_format = read_preview(filename)
+            total = header.get('total_articles')
+            size_mb = os.path.getsize(filename) / (1024 * 1024)
 
-            # Предпросмотр
             preview = f"Файл: {filename}\n"
-            preview += f"Количество статей: {data.get('total_articles', len(data.get('articles', [])))}\n"
-            preview += f"Дата экспорта: {data.get('export_date', 'Не указана')}\n\n"
+            format_names = {'ndjson': 'NDJSON', 'parquet': 'Parquet'}
+            preview += f"Формат: {format_names.get(file_format, 'JSON')}, {size_mb:.1f} МБ\n"
+            preview += f"Количество статей: {total if total is not None else 'не указано'}\n"
+            preview += f"Дата экспорта: {header.get('export_date', 'Не указана')}\n\n"
 
-            if 'articles' in data and len(data['articles']) > 0:
+            if first_records:
                 preview += "Пример первой статьи:\n"
-                first_article = data['articles'][0]
+                first_article = first_records[0]
                 preview += f"Заголовок: {first_article.get('title', 'Нет')[:50]}...\n"
                 preview += f"Тема: {first_article.get('predicted_topic', 'Не указана')}"
 
             self.preview_text.setText(preview)
 
             # Запрос подтверждения
+            count_text = f"{total} статей" if total is not None else "статьи из файла"
             reply = QMessageBox.question(
                 self, "Подтверждение импорта",
-                f"Импортировать {len(data.get('articles', []))} статей?\n"
+                f"Импортировать {count_text}?\n"
                 "Текущие данные будут заменены.",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
 
             if reply == QMessageBox.StandardButton.Yes:
-                # Здесь будет логика импорта
+                try:
+                    imported = self.run_import(filename)
+                except ImportCancelled:
+                    QMessageBox.information(self, "ℹ️ Импорт отменен",
+                                            "Импорт отменен, текущие данные не изменены")
+                    return
                 QMessageBox.information(self, "✅ Успех",
-                                        f"Импортировано {len(data.get('articles', []))} статей")
+                                        f"Импортировано {imported} статей")
 
         except Exception as e:
             QMessageBox.critical(self, "❌ Ошибка",
-                                 f"Ошибка при импорте файла:\n{str(e)}")
+                                 f"Ошибка при импорте файла:\n{str(e)}\n\n"
+                                 "Текущие данные не изменены.")
+
+    def run_import(self, filename):
+        """Загружает статьи в фоне, показывая прогресс по размеру файла"""
+        from mock_data_news import get_mock_data
+        from import_worker import run_import
+
+        try:
+            return run_import(self, filename, get_mock_data())
+        finally:
+            # Экраны держат ссылки на старый список статей (в том числе после отката)
+            parent = self.parent()
+            if parent is not None and hasattr(parent, 'reload_data_views'):
+                parent.reload_data_views()
 
     def import_filters_json(self):
         """Импорт фильтров из JSON файла"""
@@ -0,0 +1,154 @@
+"""
+Фоновый импорт статей для NewsClassify AI
+
+Файл читается и классифицируется в QThreadPool, а готовые пачки
+добавляются в MockNewsData в GUI-потоке по мере поступления, поэтому
+окно приложения не зависает. При ошибке или отмене импорт откатывается
+(import_data.ArticleImport).
+"""
+
+import threading
+import time
+
+from PyQt6.QtCore import QEventLoop, QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtWidgets import QProgressDialog
+
+from app_logging import get_logger
+from import_data import IMPORT_BATCH_SIZE, ArticleImport, ImportCancelled, read_import_batches
+from mock_data_news import MockMLClassifier
+
+
+logger = get_logger("import")
+
+
+class _ImportSignals(QObject):
+    """Сигналы задачи импорта (QRunnable не может иметь своих сигналов)"""
+    batch_ready = pyqtSignal(list, float)
+    finished = pyqtSignal()
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class ImportTask(QRunnable):
+    """Читает файл пачками в потоке пула и передает их в GUI-поток
+
+    В очереди GUI-потока ждут не больше MAX_PENDING_BATCHES пачек: поток
+    пула не читает файл дальше, пока они не добавлены (batch_applied).
+    """
+
+    MAX_PENDING_BATCHES = 2
+
+    def __init__(self, filename, state, batch_size=IMPORT_BATCH_SIZE):
+        super().__init__()
+        self.filename = filename
+        self.state = state
+        self.batch_size = batch_size
+        self.cancel_requested = False
+        self.signals = _ImportSignals()
+        self._free_slots = threading.Semaphore(self.MAX_PENDING_BATCHES)
+
+    def run(self):
+        try:
+            # Своя копия модели: кэши основного классификатора не трогаются
+            classifier = MockMLClassifier.from_state(self.state)
+            for batch, bytes_read, total_bytes in read_import_batches(
+                    self.filename, classifier, self.batch_size):
+                self._wait_free_slot()
+                self.signals.batch_ready.emit(batch, bytes_read / total_bytes if total_bytes else 1.0)
+        except ImportCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit()
+
+    def _wait_free_slot(self):
+        while not self._free_slots.acquire(timeout=0.1):
+            if self.cancel_requested:
+                raise ImportCancelled()
+        if self.cancel_requested:
+            raise ImportCancelled()
+
+    def batch_applied(self):
+        """Вызывается GUI-потоком, когда пачка обработана"""
+        self._free_slots.release()
+
+
+def run_import(parent, filename, news_data, replace=True, batch_size=IMPORT_BATCH_SIZE, pool=None):
+    """Импортирует статьи в фоне, показывая окно прогресса
+
+    Возвращает число загруженных статей. При отмене выбрасывается
+    ImportCancelled, при ошибке - RuntimeError; в обоих случаях данные
+    возвращаются к состоянию до импорта.
+    """
+    pool = pool or QThreadPool.globalInstance()
+    task = ImportTask(filename, news_data.ml_classifier.get_state(), batch_size)
+    articles_import = ArticleImport(news_data, replace)
+    loop = QEventLoop()
+    outcome = {}
+
+    title = "📥 Импорт статей..."
+    dialog = QProgressDialog(title, "Отмена", 0, 1000, parent)
+    dialog.setWindowTitle("Импорт данных")
+    dialog.setWindowModality(Qt.WindowModality.WindowModal)
+    dialog.setMinimumDuration(300)
+    dialog.setAutoReset(False)
+    dialog.setAutoClose(False)
+
+    started = time.monotonic()
+
+    def on_batch(batch, fraction):
+        try:
+            if task.cancel_requested:
+                return
+            articles_import.add(batch)
+        except Exception as e:
+            # Исключение в слоте Qt завершило бы приложение
+            outcome["error"] = str(e)
+            task.cancel_requested = True
+            return
+        finally:
+            task.batch_applied()
+
+        dialog.setValue(min(999, int(fraction * 1000)))
+        text = f"{title}\nЗагружено статей: {articles_import.count}"
+        elapsed = time.monotonic() - started
+        if elapsed > 0:
+            text += f"\n⚡ {articles_import.count / elapsed:,.0f} статей/с".replace(",", " ")
+        dialog.setLabelText(text)
+
+    def on_cancel():
+        task.cancel_requested = True
+        dialog.setLabelText(f"{title}\n⏹️ Отмена...")
+
+    def on_done(result, message=""):
+        outcome["result"] = result
+        outcome["message"] = message
+        loop.quit()
+
+    task.signals.batch_ready.connect(on_batch)
+    task.signals.finished.connect(lambda: on_done("finished"))
+    task.signals.cancelled.connect(lambda: on_done("cancelled"))
+    task.signals.failed.connect(lambda message: on_done("failed", message))
+    dialog.canceled.connect(on_cancel)
+
+    # Сигналы из потока пула приходят в очередь событий, loop их дождется
+    pool.start(task)
+    loop.exec()
+    # Отмена после последней пачки тоже отменяет импорт: пачки после
+    # нажатия "Отмена" уже не добавлялись
+    cancelled = task.cancel_requested
+    dialog.close()
+
+    if outcome["result"] != "finished" or cancelled:
+        articles_import.rollback()
+        if "error" in outcome:
+            raise RuntimeError(outcome["error"])
+        if outcome["result"] == "failed":
+            raise RuntimeError(outcome["message"])
+        logger.info("⏹️ Импорт отменен: %s", filename)
+        raise ImportCancelled()
+
+    logger.info("📥 %s: %d статей за %.1f с", filename, articles_import.count,
+                time.monotonic() - started)
+    return articles_import.count
\ No newline at end of file
@@ -3,16 +3,223 @@
 Теперь confidence разнообразный для ВСЕХ тем!
 """
 
+import hashlib
+import json
+import logging
+import os
 import random
 import re
 from datetime import datetime
-from collections import Counter
+from collections import Counter, OrderedDict
+
+from app_logging import article_log, get_logger
+from classification_stats import ClassificationStats
+from prediction_store import PersistentPredictionCache
+from search_index import ArticleSearchIndex
+
+
+# Слово в смысле regex \b: буквы, цифры и подчеркивание
+WORD_RE = re.compile(r"\w+")
+
+logger = get_logger("data")
+
+
+def _is_word_char(ch):
+    """Совпадает с определением \\w в модуле re"""
+    return ch.isalnum() or ch == "_"
+
+
+def content_hash(title, content):
+    """Хэш нормализованного текста статьи (ключ кэша предсказаний)"""
+    # Классификатор не различает регистр, поэтому и ключ от него не зависит
+    text = title.lower() + "\x00" + content.lower()
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class PredictionCache:
+    """Ограниченный LRU-кэш предсказаний со счетчиками попаданий"""
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Возвращает (тема, confidence) или None"""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        """Счетчики кэша для аналитики и отладки"""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+class KeywordMatcher:
+    """Словарь ключевых слов, скомпилированный для поиска за один проход
+
+    Считает те же совпадения, что и поиск r'\\b<слово>\\b' по каждому
+    ключевому слову отдельно, но текст разбирается на слова только один раз.
+    """
+
+    def __init__(self, topic_keywords, keyword_weights):
+        self.topics = list(topic_keywords.keys())
+        self.topic_index = {topic: i for i, topic in enumerate(self.topics)}
+
+        # Ключевое слово -> [(индекс темы, вес), ...]
+        # Одно слово может встречаться в нескольких группах и темах
+        targets = {}
+        for topic, keyword_groups in topic_keywords.items():
+            topic_idx = self.topic_index[topic]
+            for keyword_type, keywords in keyword_groups.items():
+                weight = keyword_weights[keyword_type]
+                for keyword in keywords:
+                    if keyword:
+                        targets.setdefault(keyword, []).append((topic_idx, weight))
+
+        # Каждое уникальное ключевое слово получает свой номер (столбец)
+        self.keywords = list(targets.keys())
+        self._targets = [targets[keyword] for keyword in self.keywords]
+
+        # Матрица весов для пакетного расчета строится при первом обращении
+        self._weight_matrix = None
+
+        self._words = {}      # одиночные слова: совпадение = целое слово текста
+        self._phrases = {}    # первое слово фразы -> [(фраза, столбец), ...]
+        self._fallback = []   # слова с краевыми не-буквенными символами
+        for column, keyword in enumerate(self.keywords):
+            words = WORD_RE.findall(keyword)
+            if not (_is_word_char(keyword[0]) and _is_word_char(keyword[-1])):
+                pattern = re.compile(r'\b' + re.escape(keyword) + r'\b')
+                self._fallback.append((pattern, column))
+            elif len(words) == 1 and words[0] == keyword:
+                self._words[keyword] = column
+            else:
+                self._phrases.setdefault(words[0], []).append((keyword, column))
+
+        # Для проверки заголовка достаточно найти любое слово темы как подстроку
+        self._title_patterns = []
+        for topic in self.topics:
+            keywords = [kw for group in topic_keywords[topic].values() for kw in group if kw]
+            if keywords:
+                keywords.sort(key=len, reverse=True)
+                pattern = re.compile("|".join(re.escape(kw) for kw in keywords))
+            else:
+                pattern = None
+            self._title_patterns.append(pattern)
+
+    @property
+    def weight_matrix(self):
+        """Матрица весов "ключевое слово x тема" (NumPy)"""
+        if self._weight_matrix is None:
+            import numpy as np
+
+            matrix = np.zeros((len(self.keywords), len(self.topics)))
+            for column, keyword_targets in enumerate(self._targets):
+                for topic_idx, weight in keyword_targets:
+                    matrix[column, topic_idx] += weight
+            self._weight_matrix = matrix
+        return self._weight_matrix
+
+    @staticmethod
+    def _count_phrase(text, phrase):
+        """Количество непересекающихся вхождений фразы по границам слов"""
+        count = 0
+        length = len(phrase)
+        start = text.find(phrase)
+        while start != -1:
+            end = start + length
+            if ((start == 0 or not _is_word_char(text[start - 1])) and
+                    (end == len(text) or not _is_word_char(text[end]))):
+                count += 1
+                start = text.find(phrase, end)
+            else:
+                start = text.find(phrase, start + 1)
+        return count
+
+    def keyword_counts(self, text):
+        """Пары (столбец ключевого слова, число совпадений) для текста в нижнем регистре"""
+        counts = Counter(WORD_RE.findall(text))
+
+        for word, n in counts.items():
+            column = self._words.get(word)
+            if column is not None:
+                yield column, n
+
+        for first_word, phrases in self._phrases.items():
+            if first_word not in counts:
+                continue
+            for phrase, column in phrases:
+                n = self._count_phrase(text, phrase)
+                if n:
+                    yield column, n
+
+        for pattern, column in self._fallback:
+            n = len(pattern.findall(text))
+            if n:
+                yield column, n
+
+    def weighted_counts(self, text, title):
+        """Взвешенное число совпадений для каждой темы (в порядке self.topics)
+
+        text и title должны быть уже приведены к нижнему регистру.
+        """
+        scores = [0.0] * len(self.topics)
+        for column, n in self.keyword_counts(text):
+            # Бонус за заголовок, как и раньше, проверяется подстрокой
+            if self.keywords[column] in title:
+                n += 2
+            for topic_idx, weight in self._targets[column]:
+                scores[topic_idx] += weight * n
+        return scores
+
+    def title_has_keywords(self, topic, title):
+        """Есть ли в заголовке (в нижнем регистре) хоть одно слово темы"""
+        pattern = self._title_patterns[self.topic_index[topic]]
+        return pattern is not None and pattern.search(title) is not None
 
 
 class MockMLClassifier:
     """Улучшенная имитация ML-модели с разнообразными confidence"""
 
-    def __init__(self):
+    # Факторы для разных тем (имитируем разную сложность)
+    TOPIC_DIFFICULTY = {
+        "Политика": 0.7,  # Часто междисциплинарная
+        "Экономика": 0.6,  # Много цифр и терминов
+        "Технологии": 0.8,  # Технические термины
+        "Наука": 0.9,  # Сложные концепции
+        "Медицина": 0.85,  # Специальная терминология
+        "Спорт": 0.5,  # Обычно простая
+        "Культура": 0.6,  # Средней сложности
+        "Образование": 0.7  # Может быть сложной
+    }
+
+    def __init__(self, randomize=True, cache_size=10000):
         # Расширенный словарь ключевых слов с весами
         self.topic_keywords = {
             "Политика": {
@@ -77,30 +284,97 @@ class MockMLClassifier:
         }
 
         self.training_history = []
-        print("✅ Улучшенный ML-классификатор инициализирован")
+
+        # Случайная вариация score и confidence (False - детерминированный режим)
+        self.randomize = randomize
+        self._rng = None  # генератор NumPy создается в пакетном расчете
+
+        # Скомпилированный словарь строится лениво при первом предсказании
+        self._matcher = None
+
+        # Версия модели меняется при любом изменении словарей и весов
+        self._model_version = None
+        self.cache = PredictionCache(cache_size) if cache_size else None
+        # Необязательный кэш на диске (prediction_store.PersistentPredictionCache)
+        self.persistent_cache = None
+        logger.info("✅ Улучшенный ML-классификатор инициализирован")
+
+    def get_state(self):
+        """Снимок словарей и весов модели (передается в процессы пула)"""
+        return {
+            "topic_keywords": {topic: {kind: list(words) for kind, words in groups.items()}
+                               for topic, groups in self.topic_keywords.items()},
+            "keyword_weights": dict(self.keyword_weights),
+            "topic_weights": dict(self.topic_weights),
+            "randomize": self.randomize
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """Создает классификатор из снимка get_state()"""
+        classifier = cls(randomize=state["randomize"], cache_size=0)
+        classifier.topic_keywords = state["topic_keywords"]
+        classifier.keyword_weights = state["keyword_weights"]
+        classifier.topic_weights = state["topic_weights"]
+        return classifier
+
+    def _get_matcher(self):
+        """Возвращает скомпилированный словарь, пересобирая его при необходимости"""
+        if self._matcher is None:
+            self._matcher = KeywordMatcher(self.topic_keywords, self.keyword_weights)
+        return self._matcher
+
+    @property
+    def model_version(self):
+        """Отпечаток текущих словарей и весов (часть ключа кэша)"""
+        if self._model_version is None:
+            state = json.dumps(self.get_state(), sort_keys=True, ensure_ascii=False)
+            self._model_version = hashlib.blake2b(state.encode("utf-8"), digest_size=8).hexdigest()
+        return self._model_version
+
+    def invalidate_keywords(self):
+        """Сбрасывает скомпилированный словарь и версию модели.
+
+        Вызывайте после изменения topic_keywords, keyword_weights
+        или topic_weights напрямую.
+        """
+        self._matcher = None
+        self._model_version = None
+
+    def cache_stats(self):
+        """Счетчики кэша предсказаний (None, если кэш выключен)"""
+        return self.cache.stats() if self.cache is not None else None
+
+    def update_keywords(self, topic, keyword_type, keywords):
+        """Заменяет группу ключевых слов темы и пересобирает словарь"""
+        self.topic_keywords.setdefault(topic, {})[keyword_type] = list(keywords)
+        self.topic_weights.setdefault(topic, 1.0)
+        self.invalidate_keywords()
 
     def predict_topic(self, title, content):
         """Предсказание темы с разнообразными confidence"""
+        key = None
+        if self.cache is not None:
+            key = (content_hash(title, content), self.model_version)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            if self.persistent_cache is not None:
+                cached = self.persistent_cache.get(key)
+                if cached is not None:
+                    self.cache.put(key, cached)
+                    return cached
+
         combined_text = (title + " " + content).lower()
+        matcher = self._get_matcher()
 
-        # Для каждой темы считаем score
+        # Для каждой темы считаем score за один проход по тексту
+        raw_scores = matcher.weighted_counts(combined_text, title.lower())
         topic_scores = {}
-        for topic, keyword_groups in self.topic_keywords.items():
-            score = 0
-            base_weight = self.topic_weights[topic]
-
-            for keyword_type, keywords in keyword_groups.items():
-                weight = self.keyword_weights[keyword_type]
-                for keyword in keywords:
-                    pattern = r'\b' + re.escape(keyword) + r'\b'
-                    matches = re.findall(pattern, combined_text)
-                    if matches:
-                        score += weight * len(matches)
-                        if keyword in title.lower():
-                            score += weight * 2
-
-            score *= base_weight
-            score *= random.uniform(0.8, 1.2)  # Вариация
+        for topic, score in zip(matcher.topics, raw_scores):
+            score *= self.topic_weights[topic]
+            if self.randomize:
+                score *= random.uniform(0.8, 1.2)  # Вариация
             topic_scores[topic] = score
 
         # Выбираем лучшую тему
@@ -110,7 +384,13 @@ class MockMLClassifier:
         # Вычисляем confidence
         confidence = self._calculate_confidence(best_score, topic_scores, combined_text, title, best_topic)
 
-        print(f"🎯 ML: '{title[:30]}...' → {best_topic} ({confidence:.0%})")
+        # Сообщение по каждой статье: только при включенной выборке
+        if article_log.enabled:
+            article_log.debug("🎯 ML: '%s...' → %s (%.0f%%)", title[:30], best_topic, confidence * 100)
+        if key is not None:
+            self.cache.put(key, (best_topic, confidence))
+            if self.persistent_cache is not None:
+                self.persistent_cache.put(key, (best_topic, confidence))
         return best_topic, confidence
 
     def _calculate_confidence(self, best_score, all_scores, text, title, best_topic):
@@ -125,18 +405,6 @@ class MockMLClassifier:
         else:
             lead_ratio = 0
 
-        # Факторы для разных тем (имитируем разную сложность)
-        topic_difficulty = {
-            "Политика": 0.7,  # Часто междисциплинарная
-            "Экономика": 0.6,  # Много цифр и терминов
-            "Технологии": 0.8,  # Технические термины
-            "Наука": 0.9,  # Сложные концепции
-            "Медицина": 0.85,  # Специальная терминология
-            "Спорт": 0.5,  # Обычно простая
-            "Культура": 0.6,  # Средней сложности
-            "Образование": 0.7  # Может быть сложной
-        }
-
         # Базовый confidence на основе отрыва
         if lead_ratio > 0.5:
             base_confidence = 0.93
@@ -148,7 +416,7 @@ class MockMLClassifier:
             base_confidence = 0.65
 
         # Учет сложности темы
-        difficulty = topic_difficulty.get(best_topic, 0.7)
+        difficulty = self.TOPIC_DIFFICULTY.get(best_topic, 0.7)
         difficulty_factor = 1.0 - (difficulty * 0.15)
 
         # Длина текста
@@ -161,21 +429,157 @@ class MockMLClassifier:
             length_factor = 0.9
 
         # Ключевые слова в заголовке
-        title_has_keywords = any(
-            keyword in title.lower()
-            for keyword_group in self.topic_keywords[best_topic].values()
-            for keyword in keyword_group
-        )
+        title_has_keywords = self._get_matcher().title_has_keywords(best_topic, title.lower())
         title_factor = 1.15 if title_has_keywords else 1.0
 
         # Итоговый confidence
         final_confidence = base_confidence * difficulty_factor * length_factor * title_factor
-        final_confidence *= random.uniform(0.97, 1.03)
+        if self.randomize:
+            final_confidence *= random.uniform(0.97, 1.03)
 
         # Ограничиваем и округляем
         final_confidence = max(0.6, min(0.98, final_confidence))
         return round(final_confidence, 2)
 
+    def predict_topics(self, articles):
+        """Пакетное предсказание тем для списка пар (title, content)
+
+        Возвращает два массива NumPy одинаковой длины: темы и confidence.
+        Без случайной вариации (randomize=False) результат совпадает
+        с поэлементным вызовом predict_topic.
+        """
+        import numpy as np
+
+        if self.cache is None:
+            # Без кэша в памяти дисковый кэш тоже не используется
+            return self._predict_batch(articles)
+
+        version = self.model_version
+        keys = [(content_hash(title, content), version) for title, content in articles]
+        topics = np.empty(len(articles), dtype=object)
+        confidences = np.empty(len(articles), dtype=float)
+
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self.cache.get(key)
+            if cached is None:
+                missing.append(i)
+            else:
+                topics[i], confidences[i] = cached
+
+        if missing and self.persistent_cache is not None:
+            stored = self.persistent_cache.get_many(keys[i] for i in missing)
+            still_missing = []
+            for i in missing:
+                cached = stored.get(keys[i])
+                if cached is None:
+                    still_missing.append(i)
+                else:
+                    topics[i], confidences[i] = cached
+                    self.cache.put(keys[i], cached)
+            missing = still_missing
+
+        if missing:
+            new_topics, new_confidences = self._predict_batch([articles[i] for i in missing])
+            computed = []
+            for i, topic, confidence in zip(missing, new_topics.tolist(), new_confidences.tolist()):
+                topics[i] = topic
+                confidences[i] = confidence
+                self.cache.put(keys[i], (topic, confidence))
+                computed.append((keys[i], (topic, confidence)))
+            if self.persistent_cache is not None:
+                self.persistent_cache.put_many(computed)
+
+        return topics, confidences
+
+    def _predict_batch(self, articles):
+        """Векторизованный расчет для predict_topics (без кэша)"""
+        # NumPy нужен только пакетному расчету и не грузится при запуске
+        import numpy as np
+
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+
+        matcher = self._get_matcher()
+        n_articles = len(articles)
+        n_topics = len(matcher.topics)
+        if n_articles == 0 or n_topics == 0:
+            return np.array([], dtype=object), np.array([], dtype=float)
+
+        # Одинаковые статьи (например, повторный импорт) разбираем один раз
+        unique_index = {}
+        rows = np.empty(n_articles, dtype=np.intp)
+        titles = []
+        word_counts = []
+        match_rows, match_columns, match_counts = [], [], []
+        for i, (title, content) in enumerate(articles):
+            key = (title, content)
+            row = unique_index.get(key)
+            if row is None:
+                row = unique_index[key] = len(titles)
+                combined_text = (title + " " + content).lower()
+                title_lower = title.lower()
+                for column, n in matcher.keyword_counts(combined_text):
+                    # Бонус за заголовок, как и в predict_topic
+                    if matcher.keywords[column] in title_lower:
+                        n += 2
+                    match_rows.append(row)
+                    match_columns.append(column)
+                    match_counts.append(n)
+                titles.append(title_lower)
+                word_counts.append(len(combined_text.split()))
+            rows[i] = row
+
+        # Матрица "статья x ключевое слово" -> баллы по всем темам сразу
+        counts = np.zeros((len(titles), len(matcher.keywords)))
+        np.add.at(counts, (match_rows, match_columns), match_counts)
+        scores = (counts @ matcher.weight_matrix)[rows]
+
+        topic_weights = np.array([self.topic_weights[topic] for topic in matcher.topics])
+        scores *= topic_weights
+        if self.randomize:
+            scores *= self._rng.uniform(0.8, 1.2, size=scores.shape)
+
+        best_idx = scores.argmax(axis=1)
+        best_scores = scores[np.arange(n_articles), best_idx]
+
+        # Отрыв от второй лучшей темы
+        if n_topics > 1:
+            second_best = np.partition(scores, n_topics - 2, axis=1)[:, n_topics - 2]
+            safe_best = np.where(best_scores > 0, best_scores, 1.0)
+            lead_ratio = np.where(best_scores > 0, (best_scores - second_best) / safe_best, 0.0)
+        else:
+            lead_ratio = np.zeros(n_articles)
+
+        base_confidence = np.select(
+            [lead_ratio > 0.5, lead_ratio > 0.3, lead_ratio > 0.1],
+            [0.93, 0.85, 0.75], default=0.65
+        )
+
+        difficulty = np.array([self.TOPIC_DIFFICULTY.get(topic, 0.7) for topic in matcher.topics])
+        difficulty_factor = 1.0 - (difficulty * 0.15)
+
+        word_counts = np.array(word_counts)[rows]
+        length_factor = np.select([word_counts < 50, word_counts < 150], [1.1, 1.0], default=0.9)
+
+        # Проверка заголовка нужна только для лучшей темы каждой статьи
+        title_factor = np.array([
+            1.15 if matcher.title_has_keywords(matcher.topics[topic_idx], titles[row]) else 1.0
+            for topic_idx, row in zip(best_idx.tolist(), rows.tolist())
+        ])
+
+        confidences = base_confidence * difficulty_factor[best_idx] * length_factor * title_factor
+        if self.randomize:
+            confidences *= self._rng.uniform(0.97, 1.03, size=n_articles)
+        confidences = np.clip(confidences, 0.6, 0.98)
+
+        # round() вместо np.round: округление должно совпадать с predict_topic
+        confidences = np.array([round(c, 2) for c in confidences.tolist()])
+        topics = np.array(matcher.topics, dtype=object)[best_idx]
+
+        logger.debug("🎯 ML: пакетно классифицировано %d статей", n_articles)
+        return topics, confidences
+
     def learn_from_correction(self, article_id, old_topic, new_topic):
         """Обучение на коррекции"""
         self.training_history.append({
@@ -191,28 +595,86 @@ class MockMLClassifier:
         if old_topic in self.topic_weights:
             self.topic_weights[old_topic] = max(0.5, self.topic_weights[old_topic] - 0.04)
 
-        print(f"📚 ML обучение: {old_topic} → {new_topic}")
+        # Веса изменились: старые записи кэша больше не подходят
+        self._model_version = None
+
+        logger.info("📚 ML обучение: %s → %s", old_topic, new_topic)
+
+
+class ArticleCursor:
+    """Постраничное чтение списка статей
+
+    Держит ссылку на список и смещение, поэтому страница строится только
+    при запросе. По умолчанию выдает статьи от последней к первой, как в ленте.
+    """
+
+    def __init__(self, articles, reverse=True):
+        self._articles = articles
+        self._total = len(articles)
+        self._offset = 0
+        self.reverse = reverse
+
+    @property
+    def total(self):
+        """Число статей на момент открытия курсора"""
+        return self._total
+
+    @property
+    def fetched(self):
+        """Сколько статей уже выдано"""
+        return self._offset
+
+    def has_more(self):
+        return self._offset < self._total
+
+    def fetch(self, limit):
+        """Возвращает следующую страницу (не больше limit статей)"""
+        if self.reverse:
+            end = self._total - self._offset
+            start = max(0, end - limit)
+            page = self._articles[start:end][::-1]
+        else:
+            page = self._articles[self._offset:self._offset + limit]
+
+        self._offset += len(page)
+        return page
 
 
 class MockNewsData:
-    def __init__(self):
+    def __init__(self, prediction_cache_path=None):
         self.ml_classifier = MockMLClassifier()
+
+        # Постоянный кэш предсказаний: повторный запуск на том же корпусе
+        # не классифицирует статьи заново
+        cache_path = prediction_cache_path or os.environ.get("NEWSCLASSIFY_PREDICTION_CACHE")
+        if cache_path:
+            self.ml_classifier.persistent_cache = PersistentPredictionCache(cache_path)
+            logger.info("💾 Кэш предсказаний: %s (%d записей)",
+                        cache_path, len(self.ml_classifier.persistent_cache))
+
         self.available_topics = list(self.ml_classifier.topic_keywords.keys())
-        self.articles = self._generate_diverse_articles()
+
+        # Статистика обновляется при каждом изменении статей
+        self.stats_aggregator = ClassificationStats()
+        self.classification_stats = self.stats_aggregator.stats
+
+        self._reset_indexes()
+        for article in self._generate_diverse_articles():
+            self._register_article(article)
+
         self.user_filters = []
-        self.classification_stats = self._calculate_stats()
         self.correction_history = []
 
         # Добавляем тестовые фильтры
         self._add_test_filters()
 
-        print(f"✅ Сгенерировано {len(self.articles)} статей")
-        print(f"📊 Статьи распределены по confidence:")
-        self._show_confidence_distribution()
+        logger.info("✅ Сгенерировано %d статей", len(self.articles))
+        if logger.isEnabledFor(logging.DEBUG):
+            self._show_confidence_distribution()
 
     def _add_test_filters(self):
         """Добавляет тестовые фильтры для демонстрации"""
-        print("\n🔧 Создание тестовых фильтров...")
+        logger.debug("🔧 Создание тестовых фильтров...")
 
         # Фильтр 1: ИИ в медицине
         self.create_filter(
@@ -254,7 +716,7 @@ class MockNewsData:
             logic="OR"
         )
 
-        print(f"✅ Создано {len(self.user_filters)} тестовых фильтров")
+        logger.debug("✅ Создано %d тестовых фильтров", len(self.user_filters))
 
     def _generate_diverse_articles(self):
         """Генерирует статьи с РАЗНООБРАЗНЫМИ confidence для всех тем"""
@@ -359,11 +821,14 @@ class MockNewsData:
 
         articles = []
 
+        # Получаем предсказания от ML одним пакетом
+        predicted_topics, confidences = self.ml_classifier.predict_topics(
+            [(template["title"], template["content"]) for template in article_templates]
+        )
+
         for i, template in enumerate(article_templates, 1):
-            # Получаем предсказание от ML
-            predicted_topic, confidence = self.ml_classifier.predict_topic(
-                template["title"], template["content"]
-            )
+            predicted_topic = str(predicted_topics[i - 1])
+            confidence = float(confidences[i - 1])
 
             # Корректируем confidence для соответствия целевой группе
             if template["target_confidence"] == "high":
@@ -393,119 +858,218 @@ class MockNewsData:
 
     def _show_confidence_distribution(self):
         """Показывает распределение confidence по темам"""
-        print("\n📊 РАСПРЕДЕЛЕНИЕ CONFIDENCE ПО ТЕМАМ:")
-        print("-" * 50)
+        logger.debug("📊 РАСПРЕДЕЛЕНИЕ CONFIDENCE ПО ТЕМАМ:")
+        logger.debug("-" * 50)
 
         for topic in self.available_topics:
-            topic_articles = [a for a in self.articles if a["predicted_topic"] == topic]
-            if topic_articles:
-                confidences = [a["confidence"] for a in topic_articles]
-                avg_conf = sum(confidences) / len(confidences)
-
-                # Количество в каждой группе
-                high = len([c for c in confidences if c > 0.9])
-                medium = len([c for c in confidences if 0.8 <= c <= 0.9])
-                low = len([c for c in confidences if c < 0.8])
-
-                print(f"\n{topic}:")
-                print(f"  📈 Средний confidence: {avg_conf:.1%}")
-                print(f"  🟢 Высокая: {high} статей")
-                print(f"  🟠 Средняя: {medium} статей")
-                print(f"  🔴 Низкая: {low} статей")
-
-    def _calculate_stats(self):
-        """Вычисляет статистику"""
-        total = len(self.articles)
-
-        high = len([a for a in self.articles if a["confidence"] > 0.9])
-        medium = len([a for a in self.articles if 0.8 <= a["confidence"] <= 0.9])
-        low = len([a for a in self.articles if a["confidence"] < 0.8])
-
-        return {
-            "precision": 0.87,
-            "recall": 0.82,
-            "f1_score": 0.85,
-            "total_articles": total,
-            "corrected_count": 0,
-            "high_confidence": high,
-            "medium_confidence": medium,
-            "low_confidence": low,
-            "avg_confidence": sum(a["confidence"] for a in self.articles) / total if total > 0 else 0
-        }
+            summary = self.stats_aggregator.topic_summary(topic)
+            if summary["count"]:
+                logger.debug("%s:", topic)
+                logger.debug("  📈 Средний confidence: %.1f%%", summary['avg_confidence'] * 100)
+                logger.debug("  🟢 Высокая: %d статей", summary['high'])
+                logger.debug("  🟠 Средняя: %d статей", summary['medium'])
+                logger.debug("  🔴 Низкая: %d статей", summary['low'])
+
+    def reclassify_articles(self, workers=None, chunk_size=2000):
+        """Переоценивает текущей моделью все статьи без ручной коррекции
+
+        workers=1 - в текущем процессе, иначе через ClassificationPool
+        (None - по числу ядер).
+        """
+        targets = [a for a in self.articles if a.get("true_topic") is None]
+        pairs = [(a["title"], a["content"]) for a in targets]
+
+        if workers == 1:
+            topics, confidences = self.ml_classifier.predict_topics(pairs)
+            results = zip(topics.tolist(), confidences.tolist())
+            for article, (topic, confidence) in zip(targets, results):
+                self._update_prediction(article, topic, confidence)
+        else:
+            from classification_pool import ClassificationPool
+
+            with ClassificationPool(self.ml_classifier, workers, chunk_size) as pool:
+                for article, (topic, confidence) in zip(targets, pool.classify(pairs)):
+                    self._update_prediction(article, topic, confidence)
+
+        logger.info("🔄 Переклассифицировано %d статей", len(targets))
+        return len(targets)
+
+    def _reset_indexes(self):
+        """Пустой список статей и индексы к нему"""
+        self.articles = []
+        # Статьи по id и порядковый номер статьи в self.articles
+        self._articles_by_id = {}
+        self._positions = {}
+        self._next_position = 0
+        # Тема -> {id: статья}; темы из _unsorted_topics нужно упорядочить перед выдачей
+        self._topic_members = {}
+        self._unsorted_topics = set()
+        # Индекс по тексту для фильтров с ключевыми словами
+        self.search_index = ArticleSearchIndex()
+        self.stats_aggregator.reset()
+
+    def _register_article(self, article):
+        """Добавляет статью в список и во все индексы"""
+        article_id = article["id"]
+        if article_id in self._articles_by_id:
+            raise ValueError(f"Статья с id {article_id} уже существует")
+        self.articles.append(article)
+        self._articles_by_id[article_id] = article
+        self._positions[article_id] = self._next_position
+        self._next_position += 1
+        self._topic_members.setdefault(article["predicted_topic"], {})[article_id] = article
+        self.search_index.add(article)
+        self.stats_aggregator.add(article["predicted_topic"], article["confidence"])
+
+    def _update_prediction(self, article, topic, confidence):
+        """Меняет тему и confidence статьи, обновляя индексы и статистику"""
+        old_topic = article["predicted_topic"]
+        self.stats_aggregator.change(old_topic, article["confidence"], topic, confidence)
+        article["predicted_topic"] = topic
+        article["confidence"] = confidence
+        if old_topic == topic:
+            return
+
+        article_id = article["id"]
+        old_members = self._topic_members.get(old_topic)
+        if old_members is not None:
+            old_members.pop(article_id, None)
+
+        members = self._topic_members.setdefault(topic, {})
+        if members and self._positions[article_id] < self._positions[next(reversed(members))]:
+            # Статья встала не в конец - порядок восстановим при следующем запросе
+            self._unsorted_topics.add(topic)
+        members[article_id] = article
+
+    def get_article(self, article_id):
+        """Статья по id или None"""
+        return self._articles_by_id.get(article_id)
+
+    def next_article_id(self):
+        """Свободный id для новой статьи"""
+        return max(self._articles_by_id, default=0) + 1
+
+    def add_articles(self, articles):
+        """Добавляет уже классифицированные статьи и индексирует их"""
+        articles = list(articles)
+        for article in articles:
+            self._register_article(article)
+        return len(articles)
+
+    def replace_articles(self, articles):
+        """Заменяет все статьи (например, при импорте)"""
+        self._reset_indexes()
+        return self.add_articles(articles)
+
+    def delete_articles(self, article_ids):
+        """Удаляет статьи по id, возвращает число удаленных"""
+        removed = set()
+        for article_id in article_ids:
+            article = self._articles_by_id.pop(article_id, None)
+            if article is not None:
+                del self._positions[article_id]
+                self._topic_members[article["predicted_topic"]].pop(article_id, None)
+                self.search_index.remove(article_id)
+                self.stats_aggregator.remove(article["predicted_topic"], article["confidence"])
+                removed.add(article_id)
+
+        if removed:
+            # Один проход по списку для всей пачки
+            self.articles = [a for a in self.articles if a["id"] not in removed]
+        return len(removed)
+
+    def delete_article(self, article_id):
+        """Удаляет одну статью"""
+        return self.delete_articles([article_id]) == 1
 
     def get_articles_by_filter(self, filter_topic=None):
         if not filter_topic or filter_topic == "Все темы":
             return self.articles
 
-        return [article for article in self.articles
-                if article["predicted_topic"] == filter_topic]
+        members = self._topic_members.get(filter_topic)
+        if not members:
+            return []
+
+        if filter_topic in self._unsorted_topics:
+            ordered = sorted(members.items(), key=lambda item: self._positions[item[0]])
+            members = self._topic_members[filter_topic] = dict(ordered)
+            self._unsorted_topics.discard(filter_topic)
+        return list(members.values())
+
+    def open_cursor(self, filter_topic=None, reverse=True):
+        """Курсор по статьям темы для постраничной загрузки"""
+        return ArticleCursor(self.get_articles_by_filter(filter_topic), reverse)
+
+    def count_articles_by_filter(self, filter_topic=None):
+        """Число статей по теме без построения списка"""
+        if not filter_topic or filter_topic == "Все темы":
+            return len(self.articles)
+        return len(self._topic_members.get(filter_topic, ()))
 
     def get_articles_by_keywords(self, keywords, logic="OR", topic=None):
-        """Фильтрует статьи по ключевым словам с указанной логикой"""
+        """Фильтрует статьи по ключевым словам с указанной логикой
+
+        OR - статья содержит ХОТЯ БЫ ОДНО из ключевых слов,
+        AND - статья содержит ВСЕ ключевые слова.
+        """
         if not keywords:
             return []
 
-        filtered_articles = []
+        return self.search_index.search(keywords, logic, topic)
 
-        for article in self.articles:
-            # Если указана тема, сначала проверяем её
-            if topic and article["predicted_topic"] != topic:
-                continue
+    def _apply_correction(self, article, correct_topic):
+        """Применяет коррекцию к найденной статье"""
+        article_id = article["id"]
+        old_topic = article["predicted_topic"]
+        old_confidence = article["confidence"]
 
-            combined_text = (article["title"] + " " + article["content"]).lower()
+        self._update_prediction(article, correct_topic, 1.0)
+        article["true_topic"] = correct_topic
 
-            if logic == "OR":
-                # Статья должна содержать ХОТЯ БЫ ОДНО из ключевых слов
-                for keyword in keywords:
-                    if keyword.lower() in combined_text:
-                        filtered_articles.append(article)
-                        break
-            elif logic == "AND":
-                # Статья должна содержать ВСЕ ключевые слова
-                all_present = True
-                for keyword in keywords:
-                    if keyword.lower() not in combined_text:
-                        all_present = False
-                        break
-                if all_present:
-                    filtered_articles.append(article)
-
-        return filtered_articles
+        self.ml_classifier.learn_from_correction(article_id, old_topic, correct_topic)
 
-    def correct_article_topic(self, article_id, correct_topic):
-        """Корректирует тему статьи"""
-        for article in self.articles:
-            if article["id"] == article_id:
-                old_topic = article["predicted_topic"]
-                old_confidence = article["confidence"]
+        self.correction_history.append({
+            "article_id": article_id,
+            "old_topic": old_topic,
+            "new_topic": correct_topic,
+            "old_confidence": old_confidence,
+            "new_confidence": 1.0,
+            "date": article["date"],
+            "title": article["title"][:30] + "..."
+        })
 
-                article["predicted_topic"] = correct_topic
-                article["confidence"] = 1.0
-                article["true_topic"] = correct_topic
+        self.classification_stats['corrected_count'] += 1
 
-                self.ml_classifier.learn_from_correction(article_id, old_topic, correct_topic)
+        if self.classification_stats['corrected_count'] % 5 == 0:
+            self.classification_stats['precision'] = min(
+                0.98, self.classification_stats['precision'] + 0.01
+            )
+        return old_topic
 
-                self.correction_history.append({
-                    "article_id": article_id,
-                    "old_topic": old_topic,
-                    "new_topic": correct_topic,
-                    "old_confidence": old_confidence,
-                    "new_confidence": 1.0,
-                    "date": article["date"],
-                    "title": article["title"][:30] + "..."
-                })
+    def correct_article_topic(self, article_id, correct_topic):
+        """Корректирует тему статьи"""
+        article = self._articles_by_id.get(article_id)
+        if article is None:
+            return False
 
-                self.classification_stats['corrected_count'] += 1
+        old_topic = self._apply_correction(article, correct_topic)
+        logger.info("✅ Статья %s исправлена: %s → %s", article_id, old_topic, correct_topic)
+        return True
 
-                if self.classification_stats['corrected_count'] % 5 == 0:
-                    self.classification_stats['precision'] = min(
-                        0.98, self.classification_stats['precision'] + 0.01
-                    )
+    def correct_articles(self, corrections):
+        """Применяет пачку коррекций [(id, тема), ...] за один проход
 
-                print(f"✅ Статья {article_id} исправлена: {old_topic} → {correct_topic}")
-                return True
+        Возвращает число исправленных статей (неизвестные id пропускаются).
+        """
+        corrected = 0
+        for article_id, correct_topic in corrections:
+            article = self._articles_by_id.get(article_id)
+            if article is not None:
+                self._apply_correction(article, correct_topic)
+                corrected += 1
 
-        return False
+        logger.info("✅ Исправлено статей: %d", corrected)
+        return corrected
 
     def create_filter(self, name, topic=None, keywords=None, logic="OR"):
         """Создает фильтр с ключевыми словами"""
@@ -520,12 +1084,11 @@ class MockNewsData:
         }
         self.user_filters.append(new_filter)
 
-        # Тестовый вывод для отладки
-        if keywords:
-            print(f"🔍 Создан фильтр с ключевыми словами: {keywords}")
-            # Проверим сразу, сколько статей подходит под этот фильтр
+        # Подсчет статей под фильтр - полный проход, только для отладки
+        if keywords and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Создан фильтр с ключевыми словами: %s", keywords)
             test_articles = self.get_articles_by_keywords(keywords, logic, topic)
-            print(f"🔍 Тест: найдено {len(test_articles)} статей для фильтра '{name}'")
+            logger.debug("🔍 Тест: найдено %d статей для фильтра '%s'", len(test_articles), name)
 
         return new_filter
 
@@ -533,5 +1096,33 @@ class MockNewsData:
         return [f for f in self.user_filters if f["active"]]
 
 
-# Глобальный экземпляр
-mock_data = MockNewsData()
\ No newline at end of file
+# Общий экземпляр создается при первом обращении, а не при импорте
+_mock_data = None
+_mock_data_loader = MockNewsData
+
+
+def configure_mock_data(loader):
+    """Задает функцию, которая создаст общий экземпляр данных
+
+    Вызывается до первого get_mock_data(), например чтобы загрузить
+    статьи из файла вместо генерации тестового набора.
+    """
+    global _mock_data_loader
+    if _mock_data is not None:
+        raise RuntimeError("Данные уже созданы, загрузчик нужно задать до первого обращения")
+    _mock_data_loader = loader
+
+
+def get_mock_data():
+    """Общий экземпляр MockNewsData (создается при первом вызове)"""
+    global _mock_data
+    if _mock_data is None:
+        _mock_data = _mock_data_loader()
+    return _mock_data
+
+
+def __getattr__(name):
+    # Совместимость со старым кодом: from mock_data_news import mock_data
+    if name == "mock_data":
+        return get_mock_data()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
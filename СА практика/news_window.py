@@ -6,10 +6,17 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget,
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QAction, QFont, QIcon, QTextCursor
 
-from mock_data_news import mock_data
+from app_logging import get_logger
+from mock_data_news import get_mock_data
 from feed_screen import FeedScreen
 from filters_screen import FiltersScreen
 from stats_screen import StatsScreen
+from article_card import animations_enabled, set_animations_enabled
+from classification_service import ClassificationService
+from export_data import parquet_export_available
+
+
+logger = get_logger("window")
 
 
 class DocumentationDialog(QDialog):
@@ -274,6 +281,7 @@ class AboutDialog(QDialog):
         self.init_ui()
 
     def init_ui(self):
+        mock_data = get_mock_data()
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(20)
@@ -341,7 +349,7 @@ class AboutDialog(QDialog):
             <li><b>Классификация:</b> Имитация BERT-модели</li>
             <li><b>Хранение данных:</b> Локальное (in-memory)</li>
             <li><b>Архитектура:</b> MVC (Model-View-Controller)</li>
-            <li><b>Экспорт данных:</b> JSON, CSV, Excel (pandas)</li>
+            <li><b>Экспорт данных:</b> JSON, CSV, Excel (openpyxl), Parquet (pyarrow)</li>
         </ul>
 
         <h3 style="color: #2980b9;">📊 Ключевые возможности</h3>
@@ -464,6 +472,11 @@ class MainWindow(QMainWindow):
         # Создаем экраны
         self.create_screens()
 
+        # Фоновая классификация новых статей
+        self.classification_service = ClassificationService(get_mock_data(), self)
+        self.classification_service.articles_added.connect(self.on_articles_added)
+        self.classification_service.progress.connect(self.on_classification_progress)
+
         # Создаем меню
         self.create_menu_bar()
 
@@ -662,8 +675,9 @@ class MainWindow(QMainWindow):
                     }
                 """)
 
-        # Если показываем ленту новостей - обновляем фильтры
-        if index == 0 and hasattr(self, 'feed_screen'):
+        # Экран создается при первом открытии; уже созданную ленту
+        # обновляем (список фильтров мог измениться)
+        if not self.ensure_screen(index) and index == 0:
             self.feed_screen.update_filter_list()
 
         self.content_stack.setCurrentIndex(index)
@@ -677,14 +691,32 @@ class MainWindow(QMainWindow):
             self.setWindowTitle("NewsClassify AI - Аналитика системы")
 
     def create_screens(self):
-        """Создает экраны приложения"""
-        self.feed_screen = FeedScreen()
-        self.filters_screen = FiltersScreen()
-        self.stats_screen = StatsScreen()
+        """Добавляет заглушки экранов; сами экраны создаются в ensure_screen"""
+        self.screen_factories = [
+            ("feed_screen", FeedScreen),
+            ("filters_screen", FiltersScreen),
+            ("stats_screen", StatsScreen),
+        ]
+
+        for _ in self.screen_factories:
+            self.content_stack.addWidget(QWidget())
+
+    def ensure_screen(self, index):
+        """Создает экран вместо заглушки, возвращает True если он создан сейчас"""
+        name, factory = self.screen_factories[index]
+        if hasattr(self, name):
+            return False
+
+        screen = factory()
+        setattr(self, name, screen)
+
+        placeholder = self.content_stack.widget(index)
+        self.content_stack.insertWidget(index, screen)
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
 
-        self.content_stack.addWidget(self.feed_screen)
-        self.content_stack.addWidget(self.filters_screen)
-        self.content_stack.addWidget(self.stats_screen)
+        logger.debug("🧩 Экран создан: %s", name)
+        return True
 
     def create_menu_bar(self):
         """Создает меню приложения"""
@@ -703,6 +735,10 @@ class MainWindow(QMainWindow):
         export_json_action.triggered.connect(lambda: self.export_data('articles_json'))
         export_articles_menu.addAction(export_json_action)
 
+        export_ndjson_action = QAction("🧾 Экспорт в NDJSON", self)
+        export_ndjson_action.triggered.connect(lambda: self.export_data('articles_ndjson'))
+        export_articles_menu.addAction(export_ndjson_action)
+
         export_csv_action = QAction("📊 Экспорт в CSV", self)
         export_csv_action.triggered.connect(lambda: self.export_data('articles_csv'))
         export_articles_menu.addAction(export_csv_action)
@@ -711,6 +747,11 @@ class MainWindow(QMainWindow):
         export_excel_action.triggered.connect(lambda: self.export_data('articles_excel'))
         export_articles_menu.addAction(export_excel_action)
 
+        export_parquet_action = QAction("🗃️ Экспорт в Parquet", self)
+        export_parquet_action.triggered.connect(lambda: self.export_data('articles_parquet'))
+        export_parquet_action.setEnabled(parquet_export_available())
+        export_articles_menu.addAction(export_parquet_action)
+
         # Экспорт фильтров
         export_filters_action = QAction("⚙️ Фильтры (JSON)", self)
         export_filters_action.triggered.connect(lambda: self.export_data('filters_json'))
@@ -740,6 +781,15 @@ class MainWindow(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+        # Меню Настройки
+        settings_menu = menubar.addMenu("Настройки")
+
+        animation_action = QAction("✨ Анимация карточек", self)
+        animation_action.setCheckable(True)
+        animation_action.setChecked(animations_enabled())
+        animation_action.toggled.connect(set_animations_enabled)
+        settings_menu.addAction(animation_action)
+
         # Меню Помощь
         help_menu = menubar.addMenu("Помощь")
 
@@ -772,7 +822,7 @@ class MainWindow(QMainWindow):
         """Экспорт данных системы"""
         try:
             from export_data import DataExporter
-            from mock_data_news import mock_data
+            mock_data = get_mock_data()
 
             exporter = DataExporter(self)
 
@@ -781,6 +831,18 @@ class MainWindow(QMainWindow):
                 if success:
                     QMessageBox.information(self, "✅ Успех",
                                             f"Экспортировано {len(mock_data.articles)} статей в JSON")
+                elif success is None:
+                    self.status_bar.showMessage("⏹️ Экспорт отменен", 5000)
+                else:
+                    QMessageBox.warning(self, "❌ Ошибка", "Не удалось экспортировать статьи")
+
+            elif export_type == 'articles_ndjson':
+                success = exporter.export_articles_ndjson(mock_data.articles)
+                if success:
+                    QMessageBox.information(self, "✅ Успех",
+                                            f"Экспортировано {len(mock_data.articles)} статей в NDJSON")
+                elif success is None:
+                    self.status_bar.showMessage("⏹️ Экспорт отменен", 5000)
                 else:
                     QMessageBox.warning(self, "❌ Ошибка", "Не удалось экспортировать статьи")
 
@@ -789,6 +851,8 @@ class MainWindow(QMainWindow):
                 if success:
                     QMessageBox.information(self, "✅ Успех",
                                             f"Экспортировано {len(mock_data.articles)} статей в CSV")
+                elif success is None:
+                    self.status_bar.showMessage("⏹️ Экспорт отменен", 5000)
                 else:
                     QMessageBox.warning(self, "❌ Ошибка", "Не удалось экспортировать статьи")
 
@@ -797,6 +861,18 @@ class MainWindow(QMainWindow):
                 if success:
                     QMessageBox.information(self, "✅ Успех",
                                             f"Экспортировано {len(mock_data.articles)} статей в Excel")
+                elif success is None:
+                    self.status_bar.showMessage("⏹️ Экспорт отменен", 5000)
+                else:
+                    QMessageBox.warning(self, "❌ Ошибка", "Не удалось экспортировать статьи")
+
+            elif export_type == 'articles_parquet':
+                success = exporter.export_articles_parquet(mock_data.articles)
+                if success:
+                    QMessageBox.information(self, "✅ Успех",
+                                            f"Экспортировано {len(mock_data.articles)} статей в Parquet")
+                elif success is None:
+                    self.status_bar.showMessage("⏹️ Экспорт отменен", 5000)
                 else:
                     QMessageBox.warning(self, "❌ Ошибка", "Не удалось экспортировать статьи")
 
@@ -829,13 +905,15 @@ class MainWindow(QMainWindow):
                 if success:
                     QMessageBox.information(self, "✅ Успех",
                                             f"Все данные экспортированы в папку:\n{folder}")
+                elif success is None:
+                    self.status_bar.showMessage("⏹️ Экспорт отменен", 5000)
                 else:
                     QMessageBox.warning(self, "❌ Ошибка", "Не удалось экспортировать все данные")
 
         except ImportError as e:
             print(f"❌ Ошибка импорта модуля: {e}")
             QMessageBox.warning(self, "⚠️ Предупреждение",
-                                "Модуль экспорта не найден. Установите pandas и openpyxl:\npip install pandas openpyxl")
+                                "Модуль экспорта не найден. Установите openpyxl:\npip install openpyxl")
         except Exception as e:
             print(f"❌ Ошибка экспорта: {e}")
             QMessageBox.critical(self, "❌ Критическая ошибка",
@@ -876,7 +954,7 @@ class MainWindow(QMainWindow):
     def update_live_stats(self):
         """Обновляет живую статистику в навигационной панели"""
         try:
-            from mock_data_news import mock_data
+            mock_data = get_mock_data()
 
             # Получаем актуальные данные
             articles_count = len(mock_data.articles)
@@ -900,6 +978,29 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"📊 Ошибка обновления статистики: {e}")
 
+    def reload_data_views(self):
+        """Перестраивает созданные экраны после замены всех статей (импорт)"""
+        if hasattr(self, 'feed_screen'):
+            self.feed_screen.load_articles()
+        if hasattr(self, 'stats_screen'):
+            self.stats_screen.update_stats()
+        self.update_live_stats()
+
+    def ingest_articles(self, articles):
+        """Классифицирует новые статьи в фоне и добавляет их в ленту"""
+        return self.classification_service.submit(articles)
+
+    def on_articles_added(self, articles):
+        """Передает новые статьи экранам без полной перезагрузки"""
+        if hasattr(self, 'feed_screen'):
+            self.feed_screen.on_articles_added(articles)
+        if hasattr(self, 'stats_screen'):
+            self.stats_screen.on_articles_added(articles)
+        self.update_live_stats()
+
+    def on_classification_progress(self, done, total):
+        self.status_bar.showMessage(f"🧠 Классификация: {done} из {total} статей")
+
     def update_feed_filters(self):
         """Обновляет список фильтров в ленте новостей"""
         try:
@@ -0,0 +1,247 @@
+"""
+Постоянный кэш предсказаний на диске (SQLite) для NewsClassify AI
+
+Ключ записи - хэш текста статьи и версия модели, поэтому при
+неизменном корпусе повторный запуск не классифицирует статьи заново.
+Включается переменной окружения NEWSCLASSIFY_PREDICTION_CACHE=<путь>.
+
+Командная строка:
+    python prediction_store.py info [--path ФАЙЛ]
+    python prediction_store.py clear [--path ФАЙЛ]
+    python prediction_store.py compact [--path ФАЙЛ] [--keep-versions N]
+"""
+
+import argparse
+import atexit
+import os
+import sqlite3
+import time
+
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".newsclassify", "predictions.sqlite3")
+DEFAULT_MAX_ENTRIES = 500000
+# Одиночные put копятся в памяти и записываются одной транзакцией
+DEFAULT_FLUSH_EVERY = 256
+
+
+class PersistentPredictionCache:
+    """Кэш предсказаний (тема, confidence) в файле SQLite
+
+    put() и get() по одной статье не делают commit на каждый вызов:
+    новые записи и отметки об использовании копятся в памяти и
+    сбрасываются на диск каждые flush_every операций, в flush(), close()
+    и при выходе из программы. put_many() и get_many() пишут сразу.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, max_entries=DEFAULT_MAX_ENTRIES,
+                 flush_every=DEFAULT_FLUSH_EVERY):
+        self.path = path
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self._pending = {}      # ключ -> (тема, confidence), еще не записаны
+        self._touched = set()   # ключи, найденные get(), для last_used
+
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS predictions (
+                content_hash TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                topic TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                last_used INTEGER NOT NULL,
+                PRIMARY KEY (content_hash, model_version)
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS predictions_last_used ON predictions (last_used)"
+        )
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+        atexit.register(self.flush)
+
+    def __len__(self):
+        return self._count + len(self._pending)
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self.flush)
+        self._conn.close()
+
+    def flush(self):
+        """Записывает накопленные put() и отметки get() одной транзакцией"""
+        if self._touched:
+            self._touch(self._touched)
+            self._touched = set()
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            self.put_many(pending.items())
+        else:
+            self._conn.commit()
+
+    def get(self, key):
+        """Возвращает (тема, confidence) или None"""
+        value = self._pending.get(key)
+        if value is not None:
+            return value
+
+        value = self._select([key]).get(key)
+        if value is not None:
+            self._touched.add(key)
+            self._flush_if_full()
+        return value
+
+    def put(self, key, value):
+        """Запоминает запись; на диск она попадет при следующем flush()"""
+        self._pending[key] = value
+        self._flush_if_full()
+
+    def _flush_if_full(self):
+        if len(self._pending) + len(self._touched) >= self.flush_every:
+            self.flush()
+
+    def get_many(self, keys):
+        """Словарь {ключ: (тема, confidence)} для найденных ключей"""
+        keys = list(keys)
+        found = {key: self._pending[key] for key in keys if key in self._pending}
+        stored = self._select([key for key in keys if key not in found])
+        if stored:
+            self._touch(stored)
+            self._conn.commit()
+        found.update(stored)
+        return found
+
+    def _select(self, keys):
+        """Читает записи из файла без отметки об использовании"""
+        found = {}
+        # Ограничение SQLite на число параметров в одном запросе
+        for start in range(0, len(keys), 400):
+            chunk = keys[start:start + 400]
+            condition = " OR ".join(["(content_hash = ? AND model_version = ?)"] * len(chunk))
+            params = [part for key in chunk for part in key]
+            rows = self._conn.execute(
+                "SELECT content_hash, model_version, topic, confidence FROM predictions "
+                f"WHERE {condition}", params
+            )
+            for content_hash, model_version, topic, confidence in rows:
+                found[(content_hash, model_version)] = (topic, confidence)
+        return found
+
+    def _touch(self, keys):
+        """Обновляет last_used (commit делает вызывающий код)"""
+        now = int(time.time())
+        self._conn.executemany(
+            "UPDATE predictions SET last_used = ? WHERE content_hash = ? AND model_version = ?",
+            [(now, content_hash, model_version) for content_hash, model_version in keys]
+        )
+
+    def put_many(self, items):
+        """Сохраняет пары (ключ, (тема, confidence))"""
+        now = int(time.time())
+        cursor = self._conn.executemany(
+            "INSERT OR IGNORE INTO predictions VALUES (?, ?, ?, ?, ?)",
+            [(content_hash, model_version, topic, float(confidence), now)
+             for (content_hash, model_version), (topic, confidence) in items]
+        )
+        self._conn.commit()
+        self._count += max(cursor.rowcount, 0)
+
+        if self.max_entries and self._count > self.max_entries:
+            # Удаляем с запасом, чтобы не чистить файл на каждой вставке
+            self._evict(self._count - int(self.max_entries * 0.9))
+
+    def _evict(self, count):
+        """Удаляет count давно не использованных записей"""
+        cursor = self._conn.execute("""
+            DELETE FROM predictions WHERE (content_hash, model_version) IN (
+                SELECT content_hash, model_version FROM predictions
+                ORDER BY last_used LIMIT ?
+            )
+        """, (count,))
+        self._conn.commit()
+        self._count -= max(cursor.rowcount, 0)
+
+    def clear(self):
+        """Удаляет все записи"""
+        self._pending.clear()
+        self._touched.clear()
+        self._conn.execute("DELETE FROM predictions")
+        self._conn.commit()
+        self._count = 0
+
+    def compact(self, keep_versions=None):
+        """Сжимает файл: удаляет устаревшие версии модели и лишние записи
+
+        keep_versions - сколько последних использованных версий модели оставить
+        (None - оставить все).
+        """
+        self.flush()
+        if keep_versions is not None:
+            self._conn.execute("""
+                DELETE FROM predictions WHERE model_version NOT IN (
+                    SELECT model_version FROM predictions
+                    GROUP BY model_version
+                    ORDER BY MAX(last_used) DESC LIMIT ?
+                )
+            """, (keep_versions,))
+            self._conn.commit()
+            self._count = self._conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+
+        if self.max_entries and self._count > self.max_entries:
+            self._evict(self._count - self.max_entries)
+
+        self._conn.execute("VACUUM")
+
+    def info(self):
+        """Сводка по содержимому кэша"""
+        self.flush()
+        versions = self._conn.execute("""
+            SELECT model_version, COUNT(*), MAX(last_used) FROM predictions
+            GROUP BY model_version ORDER BY MAX(last_used) DESC
+        """).fetchall()
+        return {
+            "path": self.path,
+            "entries": self._count,
+            "max_entries": self.max_entries,
+            "size_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+            "versions": versions
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Постоянный кэш предсказаний NewsClassify AI")
+    parser.add_argument("command", choices=["info", "clear", "compact"])
+    parser.add_argument("--path",
+                        default=os.environ.get("NEWSCLASSIFY_PREDICTION_CACHE") or DEFAULT_PATH,
+                        help="файл кэша (по умолчанию %(default)s)")
+    parser.add_argument("--max-entries", type=int, default=DEFAULT_MAX_ENTRIES,
+                        help="максимальное число записей")
+    parser.add_argument("--keep-versions", type=int, default=None,
+                        help="compact: сколько последних версий модели оставить")
+    args = parser.parse_args(argv)
+
+    cache = PersistentPredictionCache(args.path, args.max_entries)
+    try:
+        if args.command == "clear":
+            cache.clear()
+            cache.compact()
+            print(f"🗑️ Кэш очищен: {args.path}")
+        elif args.command == "compact":
+            cache.compact(args.keep_versions)
+            print(f"✅ Кэш сжат: {len(cache)} записей")
+
+        info = cache.info()
+        print(f"📁 Файл: {info['path']}")
+        print(f"📊 Записей: {info['entries']} из {info['max_entries']}")
+        print(f"💾 Размер: {info['size_bytes'] / 1024:.1f} КБ")
+        for version, count, last_used in info["versions"]:
+            used = time.strftime("%Y-%m-%d %H:%M", time.localtime(last_used))
+            print(f"   🔖 Версия {version}: {count} записей, использовалась {used}")
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,18 +1,26 @@
 import sys
+import time
 import subprocess
+import importlib.util
+
+# Отсчет времени до первого окна начинается до тяжелых импортов
+START_TIME = time.perf_counter()
+
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
+from app_logging import setup_logging
 from news_window import MainWindow
 
 
 def check_dependencies():
     """Проверяет и устанавливает необходимые зависимости"""
-    required_packages = ['pandas', 'openpyxl']
+    required_packages = ['openpyxl']
     missing_packages = []
 
+    # Пакеты только ищем: импорт openpyxl заметно замедляет запуск,
+    # а нужен он лишь при экспорте
     for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+        if importlib.util.find_spec(package) is None:
             missing_packages.append(package)
 
     if missing_packages:
@@ -24,7 +32,7 @@ def check_dependencies():
             print("✅ Зависимости успешно установлены!")
         except subprocess.CalledProcessError:
             print("❌ Не удалось установить зависимости.")
-            print("💡 Установите вручную: pip install pandas openpyxl")
+            print("💡 Установите вручную: pip install openpyxl")
             return False
 
     return True
@@ -48,6 +56,9 @@ def main():
     print("  - Логика И: статья содержит все слова")
     print("=" * 60)
 
+    # Уровень логов задается NEWSCLASSIFY_LOG_LEVEL
+    setup_logging()
+
     # Проверяем зависимости
     if not check_dependencies():
         print("⚠️ Запуск без поддержки экспорта в Excel...")
@@ -58,8 +69,17 @@ def main():
     window = MainWindow()
     window.show()
 
+    # Срабатывает, когда цикл событий запущен и окно отрисовано
+    QTimer.singleShot(0, report_startup_time)
+
     sys.exit(app.exec())
 
 
+def report_startup_time():
+    """Печатает время от запуска до первого показа окна"""
+    elapsed = time.perf_counter() - START_TIME
+    print(f"⏱️ Окно показано через {elapsed:.2f} с после запуска")
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
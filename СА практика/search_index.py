@@ -0,0 +1,150 @@
+"""
+Инвертированный индекс по тексту статей для фильтров с ключевыми словами
+"""
+
+import re
+from bisect import bisect_left, insort
+
+
+# Те же "слова", что и в классификаторе: буквы, цифры и подчеркивание
+WORD_RE = re.compile(r"\w+")
+
+
+class ArticleSearchIndex:
+    """Индекс слово -> статьи с поддержкой логики ИЛИ/И
+
+    Ключевое слово ищется с начала слова текста, поэтому основы вроде
+    "инвестици" или "вакцин" находят "инвестиции", "вакцина" и т.д.
+    Словарь хранится отсортированным: основа раскрывается во все слова
+    с этим префиксом двоичным поиском, раскрытия запоминаются.
+    """
+
+    def __init__(self):
+        self._postings = {}    # слово -> множество id статей
+        self._terms = []       # отсортированный словарь
+        self._articles = {}    # id -> статья
+        self._texts = {}       # id -> текст статьи в нижнем регистре
+        self._order = {}       # id -> порядковый номер (порядок выдачи)
+        self._next_order = 0
+        self._prefix_terms = {}  # основа -> слова словаря с этим префиксом
+        self._patterns = {}      # ключевое слово -> регулярное выражение проверки
+
+    def __len__(self):
+        return len(self._articles)
+
+    def add(self, article):
+        """Добавляет статью в индекс"""
+        article_id = article["id"]
+        if article_id in self._articles:
+            self.remove(article_id)
+
+        text = (article["title"] + " " + article["content"]).lower()
+        self._articles[article_id] = article
+        self._texts[article_id] = text
+        self._order[article_id] = self._next_order
+        self._next_order += 1
+
+        for term in set(WORD_RE.findall(text)):
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = set()
+                self._add_term(term)
+            postings.add(article_id)
+
+    def remove(self, article_id):
+        """Удаляет статью из индекса"""
+        text = self._texts.pop(article_id, None)
+        if text is None:
+            return
+        del self._articles[article_id]
+        del self._order[article_id]
+
+        for term in set(WORD_RE.findall(text)):
+            postings = self._postings[term]
+            postings.discard(article_id)
+            if not postings:
+                del self._postings[term]
+                self._remove_term(term)
+
+    def _add_term(self, term):
+        """Новое слово: в отсортированный словарь и в запомненные раскрытия"""
+        insort(self._terms, term)
+        for prefix, terms in self._prefix_terms.items():
+            if term.startswith(prefix):
+                terms.append(term)
+
+    def _remove_term(self, term):
+        del self._terms[bisect_left(self._terms, term)]
+        for prefix, terms in self._prefix_terms.items():
+            if term.startswith(prefix):
+                terms.remove(term)
+
+    def _expand_prefix(self, prefix):
+        """Все слова словаря, начинающиеся с основы (результат запоминается)"""
+        terms = self._prefix_terms.get(prefix)
+        if terms is None:
+            start = bisect_left(self._terms, prefix)
+            end = start
+            while end < len(self._terms) and self._terms[end].startswith(prefix):
+                end += 1
+            terms = self._prefix_terms[prefix] = self._terms[start:end]
+        return terms
+
+    def _pattern(self, keyword):
+        """Проверка: ключевое слово стоит в начале слова текста"""
+        pattern = self._patterns.get(keyword)
+        if pattern is None:
+            prefix = r"(?<!\w)" if WORD_RE.match(keyword) else ""
+            pattern = self._patterns[keyword] = re.compile(prefix + re.escape(keyword))
+        return pattern
+
+    def _matching_ids(self, keyword):
+        """id статей, текст которых содержит ключевое слово с начала слова"""
+        keyword = keyword.lower()
+        words = list(WORD_RE.finditer(keyword))
+        if not words:
+            # Ключевое слово без букв и цифр - проверяем все статьи
+            candidates = set(self._texts)
+        else:
+            candidates = None
+            for word in words:
+                if word.end() < len(keyword):
+                    # За словом в ключе идет разделитель - слово текста совпадает целиком
+                    postings = self._postings.get(word.group(), set())
+                else:
+                    # Последнее слово ключа может быть основой
+                    postings = set()
+                    for term in self._expand_prefix(word.group()):
+                        postings |= self._postings[term]
+                candidates = set(postings) if candidates is None else candidates & postings
+                if not candidates:
+                    return set()
+
+        pattern = self._pattern(keyword)
+        texts = self._texts
+        return {article_id for article_id in candidates if pattern.search(texts[article_id])}
+
+    def search(self, keywords, logic="OR", topic=None):
+        """Статьи, подходящие под ключевые слова, в порядке добавления"""
+        if not keywords:
+            return []
+
+        result = None
+        if logic == "OR":
+            result = set()
+            for keyword in keywords:
+                result |= self._matching_ids(keyword)
+        elif logic == "AND":
+            for keyword in keywords:
+                ids = self._matching_ids(keyword)
+                result = ids if result is None else result & ids
+                if not result:
+                    break
+        if not result:
+            return []
+
+        articles = self._articles
+        if topic:
+            result = [article_id for article_id in result
+                      if articles[article_id]["predicted_topic"] == topic]
+        return [articles[article_id] for article_id in sorted(result, key=self._order.__getitem__)]
\ No newline at end of file
@@ -7,7 +7,11 @@ from PyQt6.QtCore import QTimer, Qt
 from PyQt6.QtGui import QColor, QFont
 import random
 
-from mock_data_news import mock_data
+from app_logging import get_logger
+from mock_data_news import get_mock_data
+
+
+logger = get_logger("stats")
 
 
 class StatsScreen(QWidget):
@@ -18,6 +22,7 @@ class StatsScreen(QWidget):
         self.update_stats()
 
     def init_ui(self):
+        mock_data = get_mock_data()
         # СОЗДАЕМ ПРОКРУЧИВАЕМУЮ ОБЛАСТЬ
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -271,8 +276,14 @@ class StatsScreen(QWidget):
         self.timer.timeout.connect(self.update_stats)
         self.timer.start(30000)  # Обновление каждые 30 секунд
 
+    def on_articles_added(self, articles):
+        """Обновляет счетчик статей после фоновой классификации"""
+        mock_data = get_mock_data()
+        self.update_metric_card(1, str(len(mock_data.articles)))
+
     def update_stats(self):
         """Обновляет отображение статистики"""
+        mock_data = get_mock_data()
         # 1. Обновляем карточку со статьями
         self.update_metric_card(1, str(len(mock_data.articles)))
 
@@ -339,7 +350,7 @@ class StatsScreen(QWidget):
                 if parent and hasattr(parent, 'update_live_stats'):
                     parent.update_live_stats()
             except Exception as e:
-                print(f"⚠️ Не удалось обновить навигационную статистику: {e}")
+                logger.warning("⚠️ Не удалось обновить навигационную статистику: %s", e)
 
-            print(f"📊 Статистика обновлена: {len(mock_data.articles)} статей, "
-                  f"{mock_data.classification_stats['corrected_count']} коррекций")
\ No newline at end of file
+            logger.debug("📊 Статистика обновлена: %d статей, %d коррекций",
+                         len(mock_data.articles), mock_data.classification_stats['corrected_count'])
\ No newline at end of file
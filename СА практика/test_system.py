@@ -1,12 +1,40 @@
+import io
+import json
+import logging
+import os
+import re
+import tempfile
 import unittest
-from mock_data_news import MockNewsData
-from article_card import ArticleCard
+from unittest import mock
+import mock_data_news
+from mock_data_news import MockNewsData, MockMLClassifier
+from article_card import ArticleCard, animations_disabled
+from article_model import ArticleListModel, ARTICLE_ROLE
+from classification_pool import ClassificationPool
+from classification_service import ClassificationService
+from prediction_store import PersistentPredictionCache
+from check_startup_time import measure_imports, DEFERRED_MODULES
+from app_logging import ArticleLog, get_logger
+from export_data import (article_record, write_articles_json, write_articles_ndjson,
+                         write_json_envelope, write_articles_csv, ExportCancelled,
+                         write_articles_excel, excel_column_widths, EXCEL_COLUMNS,
+                         write_articles_parquet, parquet_export_available)
+from export_worker import run_export
+from import_data import (JsonRecordReader, import_articles, read_preview, read_article_columns,
+                         ImportCancelled)
+from import_worker import run_import
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QEventLoop, QTimer
 import sys
 
 
 class TestNewsClassification(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Qt-приложение нужно виджетам, моделям и QEventLoop
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
     def setUp(self):
         """Подготовка тестовых данных"""
         self.mock_data = MockNewsData()
@@ -68,6 +96,575 @@ class TestNewsClassification(unittest.TestCase):
         self.assertEqual(new_filter["topic"], "Технологии")
         self.assertTrue(new_filter["active"])
 
+    def test_keyword_matcher(self):
+        """Тест: скомпилированный словарь дает те же баллы, что и поиск по каждому слову"""
+        classifier = self.mock_data.ml_classifier
+        matcher = classifier._get_matcher()
+
+        texts = [(a["title"], a["content"]) for a in self.mock_data.articles]
+        texts.append(("Научное открытие: искусственный интеллект", "научное открытие, открытие"))
+
+        for title, content in texts:
+            combined_text = (title + " " + content).lower()
+            expected = []
+            for topic, keyword_groups in classifier.topic_keywords.items():
+                score = 0
+                for keyword_type, keywords in keyword_groups.items():
+                    weight = classifier.keyword_weights[keyword_type]
+                    for keyword in keywords:
+                        matches = re.findall(r'\b' + re.escape(keyword) + r'\b', combined_text)
+                        if matches:
+                            score += weight * len(matches)
+                            if keyword in title.lower():
+                                score += weight * 2
+                expected.append(score)
+
+            self.assertEqual(matcher.weighted_counts(combined_text, title.lower()), expected)
+
+    def test_batch_prediction(self):
+        """Тест: пакетное предсказание совпадает с поэлементным без случайности"""
+        classifier = MockMLClassifier(randomize=False)
+        pairs = [(a["title"], a["content"]) for a in self.mock_data.articles]
+
+        topics, confidences = classifier.predict_topics(pairs)
+
+        self.assertEqual(len(topics), len(pairs))
+        for (title, content), topic, confidence in zip(pairs, topics, confidences):
+            self.assertEqual(classifier.predict_topic(title, content), (topic, confidence))
+
+    def test_classification_pool(self):
+        """Тест: пул процессов возвращает результаты в исходном порядке"""
+        classifier = MockMLClassifier(randomize=False)
+        pairs = [(a["title"], a["content"]) for a in self.mock_data.articles]
+
+        expected = list(zip(*classifier.predict_topics(pairs)))
+        with ClassificationPool(classifier, workers=2, chunk_size=4) as pool:
+            self.assertEqual(list(pool.classify(pairs)), expected)
+
+    def test_reclassify_articles(self):
+        """Тест: переоценка пропускает исправленные статьи, ключ true_topic необязателен"""
+        data = self.mock_data
+        corrected = data.articles[0]
+        data.correct_article_topic(corrected["id"], "Спорт")
+        imported = dict(data.articles[1], id=data.next_article_id(), confidence=0.0)
+        del imported["true_topic"]
+        data.add_articles([imported])
+
+        count = data.reclassify_articles(workers=1)
+        self.assertEqual(count, len(data.articles) - 1)
+        self.assertEqual(corrected["predicted_topic"], "Спорт")
+        self.assertGreater(imported["confidence"], 0.0)
+
+    def test_prediction_cache(self):
+        """Тест: кэш предсказаний сбрасывается при обучении модели"""
+        classifier = MockMLClassifier(cache_size=2)
+        version = classifier.model_version
+
+        first = classifier.predict_topic("Финальный матч", "Футбол")
+        self.assertEqual(classifier.predict_topic("ФИНАЛЬНЫЙ МАТЧ", "футбол"), first)
+        self.assertEqual(classifier.cache_stats()["hits"], 1)
+
+        classifier.learn_from_correction(1, "Спорт", "Культура")
+        self.assertNotEqual(classifier.model_version, version)
+        classifier.predict_topic("Финальный матч", "Футбол")
+        classifier.predict_topic("Выставка", "Музей")
+
+        stats = classifier.cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 3, 1))
+
+    def test_persistent_prediction_cache(self):
+        """Тест: предсказания переживают перезапуск и не превышают лимит"""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "predictions.sqlite3")
+            pairs = [(a["title"], a["content"]) for a in self.mock_data.articles]
+
+            classifier = MockMLClassifier()
+            classifier.persistent_cache = PersistentPredictionCache(path)
+            topics, confidences = classifier.predict_topics(pairs)
+            classifier.persistent_cache.close()
+
+            restarted = MockMLClassifier()
+            restarted.persistent_cache = PersistentPredictionCache(path, max_entries=10)
+            restarted._predict_batch = None  # классификация не должна понадобиться
+            cached_topics, cached_confidences = restarted.predict_topics(pairs)
+            self.assertEqual(list(cached_topics), list(topics))
+            self.assertEqual(list(cached_confidences), list(confidences))
+
+            restarted.persistent_cache.compact()
+            self.assertEqual(len(restarted.persistent_cache), 10)
+            restarted.persistent_cache.close()
+
+    def test_persistent_cache_buffered_puts(self):
+        """Тест: одиночные put копятся и записываются пачкой"""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "predictions.sqlite3")
+            cache = PersistentPredictionCache(path, flush_every=3)
+            reader = PersistentPredictionCache(path)
+
+            cache.put(("a", "v1"), ("Спорт", 0.9))
+            cache.put(("b", "v1"), ("Наука", 0.8))
+            self.assertEqual(cache.get(("a", "v1")), ("Спорт", 0.9))
+            self.assertEqual(len(cache), 2)
+            self.assertIsNone(reader.get(("a", "v1")))
+
+            # Третья запись заполняет буфер
+            cache.put(("c", "v1"), ("Политика", 0.7))
+            self.assertEqual(reader.get_many([("a", "v1"), ("c", "v1")]),
+                             {("a", "v1"): ("Спорт", 0.9), ("c", "v1"): ("Политика", 0.7)})
+
+            # Остаток записывается при закрытии
+            cache.put(("d", "v1"), ("Культура", 0.6))
+            cache.close()
+            self.assertEqual(reader.get(("d", "v1")), ("Культура", 0.6))
+            reader.close()
+
+    def test_keyword_index(self):
+        """Тест: индекс находит ключевые слова и основы с начала слова"""
+        self.mock_data.add_articles([{
+            "id": 100, "title": "Инвестиции в вакцины", "content": "Биткоин и нейросеть",
+            "source": "Test", "date": "01.01.2024", "predicted_topic": "Медицина",
+            "confidence": 0.7, "true_topic": None
+        }])
+
+        queries = [
+            (["искусственный интеллект", "нейросеть"], "OR", None),
+            (["инвестици", "вакцин"], "AND", None),
+            (["криптовалют", "биткоин", "инвестици"], "OR", "Экономика"),
+            (["исследование", "ученые", "вакцин"], "AND", "Медицина"),
+            (["ков", "нейро"], "OR", None),
+        ]
+        for keywords, logic, topic in queries:
+            expected = []
+            for article in self.mock_data.articles:
+                if topic and article["predicted_topic"] != topic:
+                    continue
+                text = (article["title"] + " " + article["content"]).lower()
+                found = [re.search(r"(?<!\w)" + re.escape(keyword.lower()), text) is not None
+                         for keyword in keywords]
+                if (any(found) if logic == "OR" else all(found)):
+                    expected.append(article)
+
+            self.assertEqual(self.mock_data.get_articles_by_keywords(keywords, logic, topic), expected)
+
+    def test_bulk_correction_and_delete(self):
+        """Тест: пачка коррекций и удаление по id"""
+        corrected = self.mock_data.correct_articles([(2, "Спорт"), (3, "Культура"), (999, "Спорт")])
+
+        self.assertEqual(corrected, 2)
+        self.assertEqual(self.mock_data.get_article(2)["true_topic"], "Спорт")
+        self.assertEqual(self.mock_data.get_article(3)["confidence"], 1.0)
+
+        self.assertTrue(self.mock_data.delete_article(2))
+        self.assertFalse(self.mock_data.delete_article(2))
+        self.assertIsNone(self.mock_data.get_article(2))
+        self.assertNotIn(2, [a["id"] for a in self.mock_data.articles])
+        self.assertEqual(self.mock_data.classification_stats["total_articles"],
+                         len(self.mock_data.articles))
+
+    def test_topic_index(self):
+        """Тест: статьи по теме и счетчики после коррекции"""
+        def scan(topic):
+            return [a for a in self.mock_data.articles if a["predicted_topic"] == topic]
+
+        moved = self.mock_data.articles[-1]
+        old_topic = moved["predicted_topic"]
+        new_topic = next(t for t in self.mock_data.available_topics if t != old_topic)
+        self.mock_data.correct_articles([(moved["id"], new_topic), (1, new_topic)])
+
+        for topic in self.mock_data.available_topics:
+            self.assertEqual(self.mock_data.get_articles_by_filter(topic), scan(topic))
+            self.assertEqual(self.mock_data.count_articles_by_filter(topic), len(scan(topic)))
+
+    def test_incremental_stats(self):
+        """Тест: статистика после добавления, коррекции и удаления"""
+        data = self.mock_data
+        topic = data.available_topics[0]
+        data.add_articles([{"id": data.next_article_id(), "title": "Новость", "content": "Текст",
+                            "source": "Тест", "date": "2024-01-01", "predicted_topic": topic,
+                            "confidence": 0.85}])
+        data.correct_articles([(1, topic), (2, topic)])
+        data.delete_articles([3, 4])
+
+        confidences = [a["confidence"] for a in data.articles]
+        stats = data.classification_stats
+        self.assertEqual(stats["total_articles"], len(confidences))
+        self.assertEqual(stats["high_confidence"], sum(c > 0.9 for c in confidences))
+        self.assertEqual(stats["medium_confidence"], sum(0.8 <= c <= 0.9 for c in confidences))
+        self.assertEqual(stats["low_confidence"], sum(c < 0.8 for c in confidences))
+        self.assertAlmostEqual(stats["avg_confidence"], sum(confidences) / len(confidences))
+
+        summary = data.stats_aggregator.topic_summary(topic)
+        self.assertEqual(summary["count"], data.count_articles_by_filter(topic))
+
+    def test_article_model(self):
+        """Тест: модель ленты показывает новые статьи сверху"""
+        model = ArticleListModel()
+        model.set_articles(self.mock_data.articles)
+
+        self.assertEqual(model.rowCount(), len(self.mock_data.articles))
+        self.assertIs(model.article(0), self.mock_data.articles[-1])
+        self.assertEqual(model.index(0).data(ARTICLE_ROLE)["id"], self.mock_data.articles[-1]["id"])
+
+        changed = []
+        model.dataChanged.connect(lambda first, last, roles: changed.append(first.row()))
+        self.assertTrue(model.refresh_article(self.mock_data.articles[0]["id"]))
+        self.assertEqual(changed, [model.rowCount() - 1])
+
+    def test_card_bind(self):
+        """Тест: карточка переиспользуется для другой статьи"""
+        first, second = self.mock_data.articles[0], self.mock_data.articles[1]
+        card = ArticleCard(first)
+        card.correction_combo.setCurrentIndex(1)
+        self.assertTrue(card.correct_btn.isEnabled())
+
+        card.bind(second)
+        self.assertIs(card.article_data, second)
+        self.assertEqual(card.title_label.text(), second["title"])
+        self.assertEqual(card.topic_label.text(), second["predicted_topic"])
+        self.assertEqual(card.correction_combo.currentIndex(), 0)
+        self.assertFalse(card.correct_btn.isEnabled())
+
+    def test_card_animation(self):
+        """Тест: анимация прерывается и отключается для массовых операций"""
+        card = ArticleCard(self.mock_data.articles[0])
+
+        card.animate_percentage_increase(70, 100)
+        self.assertIn("70%", card.confidence_label.text())
+        card.stop_animation()
+        self.assertEqual(card._animation.state(), card._animation.State.Stopped)
+
+        with animations_disabled():
+            card.animate_percentage_increase(70, 100)
+        self.assertEqual(card._animation.state(), card._animation.State.Stopped)
+        self.assertIn(card.confidence_label.property("level"), ("high", "medium", "low", "corrected"))
+
+    def test_classification_service(self):
+        """Тест: фоновая классификация добавляет статьи пачками"""
+        data = self.mock_data
+        before = len(data.articles)
+        new_articles = [{"title": a["title"], "content": a["content"],
+                         "source": a["source"], "date": a["date"]}
+                        for a in data.articles * 3]
+
+        service = ClassificationService(data, batch_size=20)
+        batches, progress = [], []
+        service.articles_added.connect(batches.append)
+        service.progress.connect(lambda done, total: progress.append((done, total)))
+
+        loop = QEventLoop()
+        service.finished.connect(lambda count: loop.quit())
+        QTimer.singleShot(10000, loop.quit)
+        service.submit(new_articles)
+        loop.exec()
+
+        self.assertFalse(service.is_busy())
+        self.assertEqual(len(data.articles), before + len(new_articles))
+        self.assertEqual([len(b) for b in batches], [20, 20, 20, len(new_articles) - 60])
+        self.assertEqual(progress[-1], (len(new_articles), len(new_articles)))
+        ids = [a["id"] for a in data.articles]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertTrue(all(a["predicted_topic"] in data.available_topics for a in batches[0]))
+
+    def test_classification_service_id_collision(self):
+        """Тест: статья с уже занятым id получает новый id"""
+        data = self.mock_data
+        existing = data.articles[0]
+        before = len(data.articles)
+        new_articles = [{"id": existing["id"], "title": "Новая статья", "content": "Текст",
+                         "source": "РБК", "date": existing["date"]}]
+
+        service = ClassificationService(data)
+        added, errors = [], []
+        service.articles_added.connect(added.extend)
+        service.failed.connect(errors.append)
+
+        loop = QEventLoop()
+        service.finished.connect(lambda count: loop.quit())
+        service.failed.connect(lambda message: loop.quit())
+        QTimer.singleShot(10000, loop.quit)
+        service.submit(new_articles)
+        loop.exec()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(data.articles), before + 1)
+        self.assertNotEqual(added[0]["id"], existing["id"])
+        self.assertIs(data.get_article(existing["id"]), existing)
+
+    def test_lazy_mock_data(self):
+        """Тест: общий экземпляр данных создается один раз по запросу"""
+        data = mock_data_news.get_mock_data()
+        self.assertIs(mock_data_news.get_mock_data(), data)
+        self.assertIs(mock_data_news.mock_data, data)
+        with self.assertRaises(RuntimeError):
+            mock_data_news.configure_mock_data(MockNewsData)
+
+    def test_startup_imports(self):
+        """Тест: при запуске не загружаются numpy и модули экспорта"""
+        total_ms, modules = measure_imports("news_window")
+        self.assertIn("news_window", modules)
+        for name in DEFERRED_MODULES:
+            self.assertNotIn(name, modules)
+
+    def test_article_cursor(self):
+        """Тест: постраничная загрузка ленты"""
+        articles = self.mock_data.articles
+        cursor = self.mock_data.open_cursor()
+
+        pages = []
+        while cursor.has_more():
+            pages.extend(cursor.fetch(5))
+        self.assertEqual(pages, articles[::-1])
+        self.assertEqual(cursor.fetched, cursor.total)
+
+        model = ArticleListModel(page_size=5)
+        model.set_cursor(self.mock_data.open_cursor())
+        self.assertEqual(model.rowCount(), 5)
+        self.assertEqual(model.total, len(articles))
+        while model.canFetchMore():
+            model.fetchMore()
+        self.assertEqual(model.rowCount(), len(articles))
+        self.assertIs(model.article(len(articles) - 1), articles[0])
+
+    def test_level_gated_logging(self):
+        """Тест: отладочный вывод не выполняет лишней работы, пока выключен"""
+        # Без DEBUG фильтр не пересчитывает статьи ради тестового вывода
+        with mock.patch.object(self.mock_data, "get_articles_by_keywords") as search:
+            self.mock_data.create_filter("Тихий фильтр", keywords=["ии"])
+            search.assert_not_called()
+
+        # Лог по статьям выключен, пока доля выборки равна нулю
+        logger = get_logger("test_articles")
+        logger.setLevel(logging.DEBUG)
+        article_log = ArticleLog(logger)
+        self.assertFalse(article_log.enabled)
+        article_log.configure(0)
+        self.assertFalse(article_log.enabled)
+
+        article_log.configure(1)
+        self.assertTrue(article_log.enabled)
+        with self.assertLogs(logger, level="DEBUG") as logs:
+            article_log.debug("статья %s", 1)
+        self.assertEqual(logs.output, ["DEBUG:newsclassify.test_articles:статья 1"])
+
+    def test_streaming_export(self):
+        """Тест: потоковый экспорт статей в JSON и NDJSON"""
+        articles = self.mock_data.articles
+        expected = [article_record(a) for a in articles]
+
+        with tempfile.TemporaryDirectory() as folder:
+            json_path = os.path.join(folder, "articles.json")
+            self.assertEqual(write_articles_json(json_path, articles), len(articles))
+            with open(json_path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.assertEqual(data["total_articles"], len(articles))
+            self.assertEqual(data["articles"], expected)
+
+            ndjson_path = os.path.join(folder, "articles.ndjson")
+            self.assertEqual(write_articles_ndjson(ndjson_path, iter(articles)), len(articles))
+            with open(ndjson_path, encoding="utf-8") as f:
+                self.assertEqual([json.loads(line) for line in f], expected)
+
+        # Генератор без len(): счетчик пишется после массива
+        buffer = io.StringIO()
+        write_json_envelope(buffer, (a for a in articles[:3]))
+        data = json.loads(buffer.getvalue())
+        self.assertEqual(data["total_articles"], 3)
+        self.assertEqual(data["articles"], articles[:3])
+
+        buffer = io.StringIO()
+        write_json_envelope(buffer, [], key="filters")
+        self.assertEqual(json.loads(buffer.getvalue())["filters"], [])
+
+    def test_streaming_import(self):
+        """Тест: потоковый импорт статей из JSON и NDJSON"""
+        articles = [dict(a) for a in self.mock_data.articles]
+        articles[0]["true_topic"] = articles[0]["predicted_topic"]
+
+        with tempfile.TemporaryDirectory() as folder:
+            for name, writer in (("articles.json", write_articles_json),
+                                 ("articles.ndjson", write_articles_ndjson)):
+                path = os.path.join(folder, name)
+                writer(path, articles)
+
+                # Маленькие порции: записи и числа рвутся на границах
+                with open(path, "rb") as f:
+                    reader = JsonRecordReader(f, chunk_size=7)
+                    records = list(reader)
+                self.assertEqual(records, [article_record(a) for a in articles])
+
+                header, first, file_format = read_preview(path, limit=2)
+                self.assertEqual(len(first), 2)
+                self.assertEqual(file_format, "ndjson" if name.endswith("ndjson") else "json")
+
+                calls = []
+                data = MockNewsData()
+                imported = import_articles(path, data, batch_size=5,
+                                           progress=lambda *args: calls.append(args))
+                self.assertEqual(imported, len(articles))
+                self.assertEqual(len(calls), -(-len(articles) // 5))
+                self.assertEqual(calls[-1][1], calls[-1][2])
+                self.assertEqual([a["id"] for a in data.articles], [a["id"] for a in articles])
+                self.assertEqual(data.articles[0]["true_topic"], articles[0]["true_topic"])
+                self.assertIsNone(data.articles[1]["true_topic"])
+
+                # Добавление: занятые id заменяются новыми
+                import_articles(path, data, replace=False)
+                self.assertEqual(len(data.articles), 2 * len(articles))
+                self.assertEqual(len({a["id"] for a in data.articles}), 2 * len(articles))
+
+                # Отмена после первой пачки не трогает текущие статьи
+                current = list(data.articles)
+                with self.assertRaises(ImportCancelled):
+                    import_articles(path, data, batch_size=5, progress=lambda *args: False)
+                self.assertEqual(data.articles, current)
+
+            # Ошибка разбора в середине файла тоже
+            broken = os.path.join(folder, "broken.ndjson")
+            with open(broken, "w", encoding="utf-8") as f:
+                f.write('{"id": 1, "title": "a"}\n{"id": 2, "title": \n')
+            with self.assertRaises(ValueError):
+                import_articles(broken, data, batch_size=1)
+            self.assertEqual(data.articles, current)
+
+        # Конверт с полями после массива
+        reader = JsonRecordReader(io.BytesIO(b'{"articles": [{"id": 1}], "total_articles": 1}'))
+        self.assertEqual(list(reader), [{"id": 1}])
+        self.assertEqual(reader.header, {"total_articles": 1})
+
+    def test_background_import(self):
+        """Тест: импорт в фоне добавляет пачки и откатывается при ошибке"""
+        articles = [dict(a) for a in self.mock_data.articles * 20]
+        for i, article in enumerate(articles):
+            article["id"] = i + 1
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "articles.ndjson")
+            write_articles_ndjson(path, articles)
+
+            data = MockNewsData()
+            self.assertEqual(run_import(None, path, data, batch_size=50), len(articles))
+            self.assertEqual([a["id"] for a in data.articles], [a["id"] for a in articles])
+            counts = {topic: data.count_articles_by_filter(topic) for topic in data.available_topics}
+
+            # Ошибка после нескольких пачек: добавленные статьи убираются
+            current = list(data.articles)
+            original_add = data.add_articles
+            batches = []
+
+            def failing_add(batch):
+                batches.append(batch)
+                if len(batches) == 3:
+                    raise ValueError("сбой записи")
+                return original_add(batch)
+
+            data.add_articles = failing_add
+            with self.assertRaises(RuntimeError):
+                run_import(None, path, data, replace=False, batch_size=50)
+            self.assertEqual(data.articles, current)
+
+            # Замена откатывается к прежним статьям
+            batches.clear()
+            with self.assertRaises(RuntimeError):
+                run_import(None, path, data, batch_size=50)
+            self.assertEqual(data.articles, current)
+            self.assertEqual({topic: data.count_articles_by_filter(topic)
+                              for topic in data.available_topics}, counts)
+
+    def test_background_export(self):
+        """Тест: экспорт в фоне, отмена не оставляет файлов"""
+        articles = self.mock_data.articles * 50
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "articles.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("старый файл")
+
+            # Отмена на первом сообщении о прогрессе
+            with self.assertRaises(ExportCancelled):
+                write_articles_csv(path, articles, progress=lambda done: False)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "старый файл")
+            self.assertEqual(os.listdir(folder), ["articles.csv"])
+
+            # Полный экспорт в потоке пула
+            self.assertTrue(run_export(None, "Экспорт", len(articles),
+                                       write_articles_json, path, articles))
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["total_articles"], len(articles))
+            self.assertEqual(os.listdir(folder), ["articles.csv"])
+
+            def broken(progress=None):
+                raise OSError("диск заполнен")
+
+            with self.assertRaises(RuntimeError):
+                run_export(None, "Экспорт", 0, broken)
+
+            # Отмена отличается от ошибки
+            def cancelled(progress=None):
+                write_articles_csv(os.path.join(folder, "cancelled.csv"), articles,
+                                   progress=lambda done: False)
+
+            with self.assertRaises(ExportCancelled):
+                run_export(None, "Экспорт", len(articles), cancelled)
+            self.assertEqual(os.listdir(folder), ["articles.csv"])
+
+    def test_excel_export(self):
+        """Тест: потоковый экспорт в Excel с шириной столбцов по выборке"""
+        from openpyxl import load_workbook
+
+        articles = self.mock_data.articles
+        articles[0]["true_topic"] = "Спорт"
+        widths = excel_column_widths(articles, sample_size=5)
+        self.assertEqual(len(widths), len(EXCEL_COLUMNS))
+        self.assertTrue(all(width <= 50 for width in widths))
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "articles.xlsx")
+            self.assertEqual(write_articles_excel(path, articles), len(articles))
+
+            worksheet = load_workbook(path)["Статьи"]
+            rows = list(worksheet.iter_rows(values_only=True))
+            self.assertEqual(list(rows[0]), EXCEL_COLUMNS)
+            self.assertEqual(len(rows), len(articles) + 1)
+            self.assertEqual(rows[1][0], articles[0]["id"])
+            self.assertEqual(rows[1][7], "Спорт")
+            self.assertEqual(worksheet.column_dimensions["B"].width, excel_column_widths(articles)[1])
+
+            os.remove(path)
+            with self.assertRaises(ExportCancelled):
+                write_articles_excel(path, articles * 50, progress=lambda done: False)
+            self.assertEqual(os.listdir(folder), [])
+
+    @unittest.skipUnless(parquet_export_available(), "pyarrow не установлен")
+    def test_parquet_export(self):
+        """Тест: экспорт и импорт статей через Parquet"""
+        import pyarrow.parquet as pq
+
+        articles = self.mock_data.articles
+        articles[0]["true_topic"] = "Спорт"
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "articles.parquet")
+            self.assertEqual(write_articles_parquet(path, articles, batch_size=5), len(articles))
+
+            schema = pq.read_schema(path)
+            for name in ("source", "predicted_topic", "true_topic"):
+                self.assertTrue(str(schema.field(name).type).startswith("dictionary"))
+
+            # Только нужные столбцы
+            columns = read_article_columns(path, ["id", "predicted_topic"])
+            self.assertEqual(set(columns), {"id", "predicted_topic"})
+            self.assertEqual(columns["predicted_topic"], [a["predicted_topic"] for a in articles])
+
+            header, first, file_format = read_preview(path, limit=2)
+            self.assertEqual((header["total_articles"], len(first), file_format),
+                             (len(articles), 2, "parquet"))
+
+            data = MockNewsData()
+            self.assertEqual(import_articles(path, data, batch_size=7), len(articles))
+            for imported, original in zip(data.articles, articles):
+                for name in ("id", "title", "source", "predicted_topic", "confidence", "true_topic"):
+                    self.assertEqual(imported[name], original[name])
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file